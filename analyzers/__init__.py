@@ -1,9 +1,11 @@
+from analyzers.context import AnalyzerContext
 from analyzers.news_filter import NewsFilterAnalyzer
 from analyzers.content_analyzer import ContentAnalyzer
 from analyzers.topic_analyzer import TopicAnalyzer
 
 
 __all__ = [
+    'AnalyzerContext',
     'NewsFilterAnalyzer',
     'ContentAnalyzer',
     'TopicAnalyzer'
@@ -0,0 +1,147 @@
+import json
+import time
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol
+
+from utils import setup_logger
+
+
+class CacheBackend(Protocol):
+    """Storage backend used by LLMCache"""
+
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache backend with per-entry expiry"""
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize memory backend
+
+        :param max_size: Maximum number of cached entries
+        """
+        self.max_size = max_size
+        self._store: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.time():
+            del self._store[key]
+            return None
+
+        self._store.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        expires_at = time.time() + ttl_seconds if ttl_seconds else None
+        self._store[key] = (value, expires_at)
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_size:
+            self._store.popitem(last=False)
+
+
+class DiskCacheBackend:
+    """Persistent cache backend built on the optional `diskcache` package"""
+
+    def __init__(self, directory: str = "data/temp/llm_cache"):
+        """
+        Initialize disk backend
+
+        :param directory: Cache directory
+        """
+        import diskcache
+
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        self._cache = diskcache.Cache(directory)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        self._cache.set(key, value, expire=ttl_seconds)
+
+
+def default_backend() -> CacheBackend:
+    """
+    Get the default cache backend, preferring disk so results survive reruns
+
+    :return: Cache backend instance
+    """
+    try:
+        return DiskCacheBackend()
+    except ImportError:
+        return MemoryCacheBackend()
+
+
+class LLMCache:
+    """Exact-match cache for deterministic (temperature 0) LLM responses"""
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl_seconds: int = 86400):
+        """
+        Initialize LLM cache
+
+        :param backend: Storage backend, defaults to disk (or memory if diskcache is unavailable)
+        :param ttl_seconds: Lifetime of cached entries in seconds
+        """
+        self.logger = setup_logger("LLM Cache")
+        self.backend = backend or default_backend()
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(model: str, temperature: float, system_prompt: str, user_prompt: str) -> str:
+        """
+        Build cache key from the full request payload
+
+        :param model: Model name
+        :param temperature: Model temperature setting
+        :param system_prompt: System prompt text
+        :param user_prompt: User prompt text
+        :return: SHA256 hex digest of the payload
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "temperature": temperature,
+                "system": system_prompt,
+                "user": user_prompt
+            },
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Get cached value
+
+        :param key: Cache key
+        :return: Cached value or None on miss
+        """
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            self.logger.warning(f"Error reading LLM cache: {str(e)}")
+            return None
+
+    async def set(self, key: str, value: Dict[str, str]) -> None:
+        """
+        Store value in cache
+
+        :param key: Cache key
+        :param value: Value to cache
+        """
+        try:
+            await self.backend.set(key, value, self.ttl_seconds)
+        except Exception as e:
+            self.logger.warning(f"Error writing LLM cache: {str(e)}")
@@ -0,0 +1,127 @@
+import asyncio
+from pathlib import Path
+from typing import Collection, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+from services import LLMService
+from utils import setup_logger
+
+
+class SemanticCache:
+    """Embedding-similarity cache for news filtering results"""
+
+    def __init__(self, llm_service: LLMService, region: str, date: str, threshold: float = 0.92,
+                 cache_dir: str = "data/temp/semantic_cache"):
+        """
+        Initialize semantic cache
+
+        :param llm_service: LLM service used to compute embeddings
+        :param region: Region code, each region keeps its own cache
+        :param date: Date string (YYYYMMDD), each day keeps its own cache so results never outlive their news
+        :param threshold: Minimum cosine similarity for a cache hit
+        :param cache_dir: Directory where embeddings and results are persisted
+        """
+        self.logger = setup_logger("Semantic Cache")
+        self.llm_service = llm_service
+        self.threshold = threshold
+
+        cache_path = Path(cache_dir)
+        cache_path.mkdir(parents=True, exist_ok=True)
+        self.embeddings_path = cache_path / f"{region}_{date}_embeddings.npy"
+        self.results_path = cache_path / f"{region}_{date}_results.json"
+
+        # Normalized embeddings (N, d) and their filtered IDs
+        self.embeddings: Optional[np.ndarray] = None
+        self.results: List[List[str]] = []
+        # Serializes saves so concurrent topics never write the files at the same time,
+        # created on first store so it binds to the running event loop
+        self._save_lock: Optional[asyncio.Lock] = None
+        self._load()
+
+    def _load(self) -> None:
+        """Load persisted cache entries"""
+        try:
+            if self.embeddings_path.exists() and self.results_path.exists():
+                self.embeddings = np.load(self.embeddings_path)
+                self.results = orjson.loads(self.results_path.read_bytes())
+                if len(self.results) != len(self.embeddings):
+                    raise ValueError("Embedding and result counts do not match")
+                self.logger.debug(f"Loaded {len(self.results)} semantic cache entries")
+        except Exception as e:
+            self.logger.warning(f"Error loading semantic cache, starting empty: {str(e)}")
+            self.embeddings = None
+            self.results = []
+
+    def _save(self, embeddings: np.ndarray, results: List[List[str]]) -> None:
+        """
+        Persist cache entries
+
+        :param embeddings: Snapshot of the cached embeddings
+        :param results: Snapshot of the cached filtered IDs
+        """
+        try:
+            np.save(self.embeddings_path, embeddings)
+            self.results_path.write_bytes(orjson.dumps(results))
+        except Exception as e:
+            self.logger.warning(f"Error saving semantic cache: {str(e)}")
+
+    @staticmethod
+    def build_probe(topic_content: str, article_ids: List[str]) -> str:
+        """
+        Build the text embedded for the cache lookup
+
+        :param topic_content: Topic content
+        :param article_ids: Candidate article IDs
+        :return: Probe text
+        """
+        return topic_content + "|" + ",".join(sorted(str(article_id) for article_id in article_ids))
+
+    async def lookup(self, probe: str, candidate_ids: Collection[str]) -> Tuple[Optional[List[str]], np.ndarray]:
+        """
+        Look up the most similar cached probe whose result fits the current candidates
+
+        :param probe: Probe text
+        :param candidate_ids: IDs of the current candidate news, a cached result only counts
+                              as a hit if all of its IDs are among them
+        :return: (cached filtered IDs or None on miss, normalized probe embedding)
+        """
+        query = np.asarray(await self.llm_service.embed(probe), dtype=np.float32)
+        query /= np.linalg.norm(query) or 1.0
+
+        if self.embeddings is None or not len(self.embeddings):
+            return None, query
+
+        sims = self.embeddings @ query
+        above = np.flatnonzero(sims > self.threshold)
+        for index in above[np.argsort(-sims[above])]:
+            result = self.results[index]
+            if result and all(article_id in candidate_ids for article_id in result):
+                self.logger.info(f"Semantic cache hit (similarity {sims[index]:.3f})")
+                return result, query
+
+        return None, query
+
+    async def store(self, embedding: np.ndarray, filtered_ids: List[str]) -> None:
+        """
+        Store a filtering result, empty results are never cached
+
+        :param embedding: Normalized probe embedding returned by lookup
+        :param filtered_ids: Filtered news IDs
+        """
+        if not filtered_ids:
+            return
+
+        if self.embeddings is None:
+            self.embeddings = embedding[np.newaxis, :]
+        else:
+            self.embeddings = np.vstack([self.embeddings, embedding])
+        self.results.append(list(filtered_ids))
+
+        # Write off the event loop; the snapshot keeps later stores from changing what is written
+        embeddings, results = self.embeddings, list(self.results)
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+        async with self._save_lock:
+            await asyncio.get_running_loop().run_in_executor(None, self._save, embeddings, results)
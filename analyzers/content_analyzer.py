@@ -1,51 +1,122 @@
-import asyncio
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple, Set
 
-from services import LLMService, PromptService, PromptCategory
-from utils import setup_logger, get_config_loader
+from services import PromptCategory, STREAM_INTERRUPTED_ERRORS
+from utils import setup_logger
 from reporting import ReportValidator
 from models import NewsArticle, Topic
+from analyzers._llm_cache import LLMCache
+from analyzers.context import AnalyzerContext
 
 
 
 class ContentAnalyzer:
     """Generate report content"""
     
-    def __init__(self, region: str, date: str):
+    def __init__(self, region: str, date: str, ctx: Optional[AnalyzerContext] = None):
         """
         Initialize the report content analyzer
         
         :param region: Region code
         :param date: Date string (YYYYMMDD)
+        :param ctx: Shared analyzer services, created if not provided
         """
         self.region = region
         self.date = date
         self.logger = setup_logger("Content Analyzer")
         
         # Initialize services
-        self.llm_service = LLMService(
-            temperature=0,
-            model_name="gpt-4o",
-            region=region
-        )
-        self.prompt_service = PromptService()
+        ctx = ctx or AnalyzerContext.create()
+        self.llm_service = ctx.llm
+        self.prompt_service = ctx.prompts
+        
+        # Cache deterministic responses so retries and reruns skip the LLM call
+        self.cache = ctx.cache if self.llm_service.temperature == 0 else None
         
         # Initialize content validator
-        self.validator = ReportValidator()
+        self.validator = ReportValidator(llm_service=ctx.llm)
         
         # Use ConfigLoader to load configuration
-        self.config_loader = get_config_loader()
+        self.config_loader = ctx.config
         
         # Get language for the region from configuration
         self.source_lang = self.config_loader.get_region_language(region)
         self.logger.info(f"Initialized with region {region} and language {self.source_lang}")
+        
+        # Last built topic index, reused while the same news list is passed in
+        self._topic_index_cache = None
+    
+    def _build_topic_index(self, filtered_news: List[Union[Dict, NewsArticle]]) -> Tuple[List[str], Dict[int, Set[int]]]:
+        """
+        Build news summaries and a topic ID to news index mapping in one pass
+        
+        :param filtered_news: Filtered news list (list of NewsArticle objects or dictionaries)
+        :return: (summaries, {topic_id: set of news indices})
+        """
+        summaries = []
+        topic_to_indices = {}
+        for idx, news in enumerate(filtered_news):
+            if isinstance(news, NewsArticle):
+                news_topics = news.topics
+                summary = news.summary or news.title
+            else:
+                news_topics = news.get('topics', [])
+                summary = news.get('summary', '') or news.get('title', '')
+            
+            summaries.append(summary)
+            for news_topic in news_topics or []:
+                if isinstance(news_topic, dict):
+                    topic_to_indices.setdefault(news_topic.get('topic_id'), set()).add(idx)
+        
+        return summaries, topic_to_indices
+    
+    def _get_topic_index(self, filtered_news: List[Union[Dict, NewsArticle]]) -> Tuple[List[str], Dict[int, Set[int]]]:
+        """
+        Get topic index for a news list, reusing the last one if the list is unchanged
+        
+        :param filtered_news: Filtered news list
+        :return: (summaries, {topic_id: set of news indices})
+        """
+        cached = self._topic_index_cache
+        if cached is not None and cached[0] is filtered_news and cached[1] == len(filtered_news):
+            return cached[2]
+        
+        index = self._build_topic_index(filtered_news)
+        self._topic_index_cache = (filtered_news, len(filtered_news), index)
+        return index
     
-    async def generate_report_content(self, topic: Union[Dict, Topic], filtered_news: List[Union[Dict, NewsArticle]]) -> Dict[str, str]:
+    async def _stream_report(self, system_prompt: str, user_prompt: str, check_after: int = 50) -> Optional[str]:
+        """
+        Stream a report response, aborting early if it doesn't start in the expected format
+        
+        :param system_prompt: System prompt text
+        :param user_prompt: User prompt text
+        :param check_after: Number of streamed chunks to receive before checking the format
+        :return: Full response text, or None if the stream was aborted
+        """
+        chunks = []
+        stream = self.llm_service.chat_stream(system_prompt, user_prompt)
+        try:
+            async for delta in stream:
+                chunks.append(delta)
+                if len(chunks) == check_after and not self.validator.looks_like_valid_prefix(''.join(chunks)):
+                    return None
+        finally:
+            await stream.aclose()
+        
+        return ''.join(chunks).strip()
+    
+    async def generate_report_content(
+        self,
+        topic: Union[Dict, Topic],
+        filtered_news: List[Union[Dict, NewsArticle]],
+        use_cache: bool = True
+    ) -> Dict[str, str]:
         """
         Generate report content for a topic
         
         :param topic: Topic data (Topic object or dictionary)
         :param filtered_news: Filtered news list (list of NewsArticle objects or dictionaries)
+        :param use_cache: Whether to return a cached response; the new result is cached either way
         :return: Report content {'title': 'title', 'content': 'content'}
         """
         try:
@@ -60,27 +131,12 @@ class ContentAnalyzer:
             self.logger.info(f"Generating report for topic {topic_id}: {topic_content[:50]}...")
             
             # 提取相關新聞的摘要，優先使用有相同主題ID的新聞
-            news_summaries = []
-            for news in filtered_news:
-                if isinstance(news, NewsArticle):
-                    news_topics = news.topics
-                    summary = news.summary or news.title
-                else:
-                    news_topics = news.get('topics', [])
-                    summary = news.get('summary', '') or news.get('title', '')
-                
-                # 檢查新聞是否屬於當前主題
-                is_relevant = False
-                if news_topics:
-                    for news_topic in news_topics:
-                        if isinstance(news_topic, dict) and news_topic.get('topic_id') == topic_id:
-                            is_relevant = True
-                            break
-                
-                if is_relevant:
-                    news_summaries.insert(0, summary)  # 相關新聞放在前面
-                else:
-                    news_summaries.append(summary)
+            summaries, topic_to_indices = self._get_topic_index(filtered_news)
+            relevant = topic_to_indices.get(topic_id, set())
+            relevant_summaries, other_summaries = [], []
+            for i, summary in enumerate(summaries):
+                (relevant_summaries if i in relevant else other_summaries).append(summary)
+            news_summaries = relevant_summaries + other_summaries  # 相關新聞放在前面
             
             system_prompt = self.prompt_service.get_prompt(
                 category=PromptCategory.REPORT_GENERATION,
@@ -97,49 +153,64 @@ class ContentAnalyzer:
             self.logger.debug(f"System Prompt: {system_prompt}")
             self.logger.debug(f"User Prompt: {user_prompt}")
             
-            # Try up to 3 times
+            # Check cache before calling the LLM
+            cache_key = None
+            if self.cache:
+                cache_key = LLMCache.make_key(
+                    self.llm_service.model,
+                    self.llm_service.temperature,
+                    system_prompt,
+                    user_prompt
+                )
+                cached = await self.cache.get(cache_key) if use_cache else None
+                if cached and self.validator.validate_report_format(cached):
+                    self.logger.info(f"Using cached report for topic {topic_id}")
+                    return cached
+            
+            # Try up to 3 times for a valid format and length
+            # (errors opening the stream are retried inside LLMService, a stream
+            # dropped mid-response moves on to the next attempt)
             for attempt in range(3):
                 try:
-                    response = await self.llm_service.chat(
-                        system_prompt=system_prompt,
-                        user_prompt=user_prompt
-                    )
-                    self.logger.debug(f"Response: {response}")
-                    
-                    # Extract title and content from response
-                    result = self.validator.extract_title_content(response)
-                    
-                    # Validate report format
-                    if not self.validator.validate_report_format(result):
-                        self.logger.warning(f"Invalid report format on attempt {attempt+1}/3")
-                        continue
-                    
-                    # Validate word count
-                    is_valid, reason, word_count = self.validator.validate_word_count(
-                        result.get('content', ''), 
-                        min_words=500, 
-                        max_words=2000
-                    )
-                    
-                    if not is_valid:
-                        self.logger.warning(f"Invalid content length: {reason}, attempt {attempt+1}/3")
-                        # If content is too long or too short but this is the last attempt, return result anyway
-                        if attempt == 2:
-                            self.logger.info(f"Returning report despite invalid length: {word_count} words")
-                            return result
-                        continue
-                    
-                    # If all validations pass, return the result
-                    self.logger.info(f"Successfully generated report with {word_count} words")
-                    return result
-                        
-                except Exception as e:
-                    self.logger.warning(f"Report generation error on attempt {attempt+1}/3: {str(e)}")
-                    
-                    if attempt == 2:  # Last attempt
-                        raise
+                    response = await self._stream_report(system_prompt, user_prompt)
+                except STREAM_INTERRUPTED_ERRORS as e:
+                    self.logger.warning(f"Report stream interrupted on attempt {attempt+1}/3: {str(e)}")
+                    continue
+                if response is None:
+                    self.logger.warning(f"Aborted response with invalid format on attempt {attempt+1}/3")
+                    continue
+                self.logger.debug(f"Response: {response}")
+                
+                # Extract title and content from response
+                result = self.validator.extract_title_content(response)
+                
+                # Validate report format
+                if not self.validator.validate_report_format(result):
+                    self.logger.warning(f"Invalid report format on attempt {attempt+1}/3")
+                    continue
+                
+                # Validate word count
+                is_valid, reason, word_count = self.validator.validate_word_count(
+                    result.get('content', ''), 
+                    min_words=500, 
+                    max_words=2000
+                )
+                
+                if not is_valid:
+                    self.logger.warning(f"Invalid content length: {reason}, attempt {attempt+1}/3")
+                    # If content is too long or too short but this is the last attempt, return result anyway
+                    if attempt == 2:
+                        self.logger.info(f"Returning report despite invalid length: {word_count} words")
+                        return result
+                    continue
+                
+                # If all validations pass, return the result
+                self.logger.info(f"Successfully generated report with {word_count} words")
+                if cache_key:
+                    await self.cache.set(cache_key, result)
+                return result
             
             raise Exception("Failed to generate valid report after 3 attempts")
         except Exception as e:
             self.logger.error(f"Error generating report content: {str(e)}")
-            raise
\ No newline at end of file
+            raise
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from services import LLMService, PromptService
+from utils import ConfigLoader, get_config_loader
+from analyzers._llm_cache import LLMCache
+
+
+@dataclass
+class AnalyzerContext:
+    """Services shared by all analyzers, built once per run"""
+
+    llm: LLMService
+    prompts: PromptService
+    config: ConfigLoader
+    cache: Optional[LLMCache] = None
+
+    @classmethod
+    def create(cls, model_name: str = "gpt-4o", temperature: float = 0) -> 'AnalyzerContext':
+        """Create a context with default services
+
+        :param model_name: Name of the model to use
+        :param temperature: Model temperature setting
+        :return: AnalyzerContext instance
+        """
+        llm = LLMService(model_name=model_name, temperature=temperature)
+
+        return cls(
+            llm=llm,
+            prompts=PromptService(),
+            config=get_config_loader(),
+            # Only deterministic responses are safe to cache
+            cache=LLMCache(ttl_seconds=86400) if temperature == 0 else None
+        )
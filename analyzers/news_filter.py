@@ -1,41 +1,99 @@
-import json
-import asyncio
-from typing import List, Dict, Any, Optional, Union
+import re
+import orjson
+import numpy as np
+from typing import List, Dict, Optional, Union
 from datetime import datetime
 
-from services import LLMService, TokenLimitError, PromptService, PromptCategory
+from services import TokenLimitError, PromptCategory
 from utils import setup_logger
 from models import NewsArticle, Topic
+from analyzers._semantic_cache import SemanticCache
+from analyzers.context import AnalyzerContext
+
+
+# Single-pass scan of the response: group 1 matches "Article ID: 123" entries in the
+# expected format, groups 2-4 match fallback numeric identifiers ("ID: nnn", "#nnn"
+# or numbered list format)
+_ID_SCAN_RE = re.compile(
+    r'Article ID:\s*["\']?([^\s,:\'"]+)|ID:\s*(\d+)|#(\d+)|^(\d+)[.,)]',
+    re.M
+)
+
+# Structured output schema for news filtering responses
+_NEWS_FILTER_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "news_filter",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "selected_ids": {
+                    "type": "array",
+                    "items": {"type": "string"}
+                }
+            },
+            "required": ["selected_ids"],
+            "additionalProperties": False
+        }
+    }
+}
 
 
 class NewsFilterAnalyzer:
     """Analyze and filter news related to a topic"""
     
-    def __init__(self, region: str, date: str):
+    def __init__(self, region: str, date: str, ctx: Optional[AnalyzerContext] = None):
         """
         Initialize news filter analyzer
         
         :param region: Region code
         :param date: Date string (YYYYMMDD)
+        :param ctx: Shared analyzer services, created if not provided
         """
         self.region = region
         self.date = date
         self.logger = setup_logger("News Filter")
         
         # Initialize services
-        self.llm_service = LLMService(
-            temperature=0,
-            model_name="gpt-4o",
-            region=region
+        ctx = ctx or AnalyzerContext.create()
+        self.llm_service = ctx.llm
+        self.prompt_service = ctx.prompts
+        
+        # Maximum number of candidates sent to the LLM, the rest are dropped by embedding similarity
+        self.prefilter_top_k = ctx.config.get_system_config().get('prefilter_top_k', 30)
+        
+        # Reuse filtering results of near-duplicate topics
+        region_info = ctx.config.get_region_info(region)
+        self.semantic_cache = SemanticCache(
+            llm_service=self.llm_service,
+            region=region,
+            date=date,
+            threshold=region_info.get('semantic_cache_threshold', 0.92)
         )
-        self.prompt_service = PromptService()
     
-    async def filter_related_news(self, topic: Union[Dict, Topic], news_list: List[Any]) -> List[NewsArticle]:
+    @staticmethod
+    def get_topic_news(topic: Union[Dict, Topic], news_list: List[NewsArticle]) -> List[NewsArticle]:
+        """
+        Get the news assigned to the topic by topic modeling
+        
+        :param topic: Topic object or dictionary
+        :param news_list: News list of NewsArticle objects
+        :return: News whose IDs are in the topic's article IDs
+        """
+        article_ids = topic['article_ids'] if isinstance(topic, dict) else topic.article_ids
+        article_ids_set = {str(article_id) for article_id in article_ids}
+        return [news for news in news_list if str(news.id) in article_ids_set]
+    
+    async def filter_related_news(self, topic: Union[Dict, Topic], news_list: List[NewsArticle]) -> List[NewsArticle]:
         """
         Filter news related to the topic
         
+        Errors are logged and re-raised, so callers can tell a failed filtering from
+        an LLM result and pick their own fallback.
+        
         :param topic: Topic object or dictionary
-        :param news_list: News list (can be NewsArticle objects or dictionaries)
+        :param news_list: News list, already normalized to NewsArticle objects by the loader
         :return: Filtered news list
         """
         try:
@@ -50,14 +108,7 @@ class NewsFilterAnalyzer:
             self.logger.info(f"Filtering news for topic {topic_id}, found {len(article_ids)} related articles")
             
             # 使用 article_ids 直接找出相關新聞
-            topic_related_news = []
-            for news in news_list:
-                news_id = str(news.id if isinstance(news, NewsArticle) else news.get('_id'))
-                if news_id in article_ids:
-                    if isinstance(news, NewsArticle):
-                        topic_related_news.append(news)
-                    else:
-                        topic_related_news.append(NewsArticle.from_dict(news))
+            topic_related_news = self.get_topic_news(topic, news_list)
             
             if not topic_related_news:
                 self.logger.warning(f"No news found for topic {topic_id}")
@@ -65,42 +116,72 @@ class NewsFilterAnalyzer:
             
             self.logger.info(f"Found {len(topic_related_news)} news articles for topic {topic_id}")
             
+            topic_content = topic.content if isinstance(topic, Topic) else topic['content']
+            
+            # 以向量相似度預先篩選，減少送入 LLM 的新聞數量
+            if len(topic_related_news) > self.prefilter_top_k:
+                try:
+                    topic_related_news = await self._prefilter_by_embedding(topic_content, topic_related_news)
+                except Exception as e:
+                    self.logger.warning(f"Embedding prefilter failed, using all related news: {str(e)}")
+            
             # 使用 LLM 進一步過濾
-            simplified_news = [
-                {
-                    '_id': str(news.id),
+            simplified_news = []
+            id_lookup = {}
+            for news in topic_related_news:
+                news_id = str(news.id)
+                simplified_news.append({
+                    '_id': news_id,
                     'title': news.title,
                     'published_at': news.published_at.isoformat() if isinstance(news.published_at, datetime) else news.published_at,
                     'summary': news.summary
-                }
-                for news in topic_related_news
-            ]
-            
-            # 呼叫 LLM 進行過濾
-            system_prompt = self.prompt_service.get_prompt(
-                category=PromptCategory.NEWS_FILTERING,
-                prompt_name="system"
-            )
+                })
+                id_lookup[news_id] = news
+            
+            # 查詢語意快取
+            probe = SemanticCache.build_probe(topic_content, [news['_id'] for news in simplified_news])
+            filtered_ids, probe_embedding = None, None
+            try:
+                filtered_ids, probe_embedding = await self.semantic_cache.lookup(probe, id_lookup.keys())
+            except Exception as e:
+                self.logger.warning(f"Semantic cache lookup failed: {str(e)}")
+            
+            if filtered_ids is None:
+                # 呼叫 LLM 進行過濾
+                system_prompt = self.prompt_service.get_prompt(
+                    category=PromptCategory.NEWS_FILTERING,
+                    prompt_name="system"
+                )
 
-            self.logger.debug(f"System prompt: {system_prompt}")
-            
-            user_prompt = self.prompt_service.get_prompt(
-                category=PromptCategory.NEWS_FILTERING,
-                prompt_name="user",
-                topic_content=topic.content if isinstance(topic, Topic) else topic['content'],
-                news_list=json.dumps(simplified_news, ensure_ascii=False)
-            )
-            self.logger.debug(f"User prompt: {user_prompt}")
+                self.logger.debug(f"System prompt: {system_prompt}")
+                
+                user_prompt = self.prompt_service.get_prompt(
+                    category=PromptCategory.NEWS_FILTERING,
+                    prompt_name="user",
+                    topic_content=topic_content,
+                    news_list=orjson.dumps(simplified_news).decode()
+                )
+                self.logger.debug(f"User prompt: {user_prompt}")
 
-            response = await self.llm_service.chat(system_prompt, user_prompt)
-            self.logger.debug(f"LLM response: {response}")
+                response = await self.llm_service.chat(
+                    system_prompt,
+                    user_prompt,
+                    response_format=_NEWS_FILTER_RESPONSE_FORMAT
+                )
+                self.logger.debug(f"LLM response: {response}")
+                
+                filtered_ids = self._parse_news_filtering(response, simplified_news)
+                
+                if probe_embedding is not None:
+                    try:
+                        await self.semantic_cache.store(probe_embedding, filtered_ids)
+                    except Exception as e:
+                        self.logger.warning(f"Semantic cache store failed: {str(e)}")
             
-            filtered_ids = self._parse_news_filtering(response, simplified_news)
             self.logger.debug(f"Filtered IDs: {filtered_ids}")
             
             # 返回過濾後的新聞
             final_news = []
-            id_lookup = {str(news.id): news for news in topic_related_news}
             for article_id in filtered_ids:
                 if article_id in id_lookup:
                     final_news.append(id_lookup[article_id])
@@ -110,7 +191,34 @@ class NewsFilterAnalyzer:
             
         except Exception as e:
             self.logger.error(f"Error filtering related news: {str(e)}")
-            return topic_related_news[:10]  # 如果發生錯誤，返回前10篇相關新聞
+            raise
+    
+    async def _prefilter_by_embedding(self, topic_content: str, news_list: List[NewsArticle]) -> List[NewsArticle]:
+        """
+        Keep the news most similar to the topic by embedding cosine similarity
+        
+        Article embeddings are computed once and kept on the NewsArticle objects.
+        
+        :param topic_content: Topic content
+        :param news_list: Candidate news list
+        :return: Top prefilter_top_k news, most similar first
+        """
+        missing = [news for news in news_list if news.embedding is None]
+        if missing:
+            vectors = await self.llm_service.embed_many([f"{news.title}\n{news.summary}" for news in missing])
+            for news, vector in zip(missing, vectors):
+                vector = np.asarray(vector, dtype=np.float32)
+                news.embedding = vector / (np.linalg.norm(vector) or 1.0)
+        
+        topic_vec = np.asarray(await self.llm_service.embed(topic_content), dtype=np.float32)
+        topic_vec /= np.linalg.norm(topic_vec) or 1.0
+        
+        scores = np.stack([news.embedding for news in news_list]) @ topic_vec
+        top = np.argpartition(-scores, self.prefilter_top_k)[:self.prefilter_top_k]
+        top = top[np.argsort(-scores[top])]
+        
+        self.logger.info(f"Prefiltered {len(news_list)} news articles to {len(top)} by embedding similarity")
+        return [news_list[i] for i in top]
     
     def _parse_news_filtering(self, response: str, news_list: List[Dict]) -> List[str]:
         """
@@ -137,31 +245,40 @@ class NewsFilterAnalyzer:
                 if 'id' in news:
                     id_mapping[str(news.get('id', ''))] = news_id
             
-            # Find all "Article ID:" lines
-            lines = response.split('\n')
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if 'Article ID:' in line:
-                    # Parse ID (possible format: Article ID: 123)
-                    parts = line.split('Article ID:', 1)
-                    if len(parts) > 1:
-                        article_id = parts[1].strip().strip(',').strip(':').strip('"').strip("'")
-                        article_id = article_id.split(' ')[0]  # Split in case there's other text after the ID
-                        
-                        if article_id in id_mapping:
-                            filtered_ids.append(id_mapping[article_id])
-                        else:
-                            self.logger.warning(f"Cannot find article ID {article_id} in mapping: {id_mapping}")
+            # Parse structured output {"selected_ids": [...]}
+            try:
+                selected_ids = orjson.loads(response)['selected_ids']
+                filtered_ids = [id_mapping[str(article_id)] for article_id in selected_ids if str(article_id) in id_mapping]
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                self.logger.warning("Response is not valid structured output, falling back to text parsing")
+            
+            if filtered_ids:
+                self.logger.info(f"Successfully filtered {len(filtered_ids)} articles")
+                return filtered_ids
+            
+            # Scan once for "Article ID:" entries and fallback numeric identifiers
+            numeric_ids = []
+            for match in _ID_SCAN_RE.finditer(response):
+                article_id = match.group(1)
+                if article_id is not None:
+                    if article_id in id_mapping:
+                        filtered_ids.append(id_mapping[article_id])
+                    else:
+                        self.logger.warning(f"Cannot find article ID {article_id} in mapping: {id_mapping}")
+                else:
+                    numeric_id = match.group(2) or match.group(3) or match.group(4)
+                    if numeric_id in id_mapping:
+                        numeric_ids.append(id_mapping[numeric_id])
 
             # If no specified format found, try to parse directly from JSON
-            if not filtered_ids:
+            if not filtered_ids and '{' in response:
                 try:
                     # Try to extract JSON portion from the response
                     json_start = response.find('{')
                     json_end = response.rfind('}')
                     if json_start >= 0 and json_end > json_start:
                         json_str = response[json_start:json_end+1]
-                        json_data = json.loads(json_str)
+                        json_data = orjson.loads(json_str)
                         
                         # Check different possible key names
                         possible_keys = ['selected_articles', 'filtered_news', 'relevant_articles', 'articles', 'ids']
@@ -178,27 +295,14 @@ class NewsFilterAnalyzer:
                                         
                                     if article_id in id_mapping:
                                         filtered_ids.append(id_mapping[article_id])
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     self.logger.warning("Failed to parse JSON from response")
                 except Exception as e:
                     self.logger.warning(f"Error processing JSON from response: {str(e)}")
                     
-            # If still not found, try to find numeric identifiers
+            # If still not found, use numeric identifiers
             if not filtered_ids:
-                for line in lines:
-                    # Look for "ID: nnn" or "#nnn" or numbered list format
-                    patterns = [
-                        r'ID:\s*(\d+)',
-                        r'#(\d+)',
-                        r'^(\d+)[.,)]'
-                    ]
-                    for pattern in patterns:
-                        import re
-                        matches = re.findall(pattern, line)
-                        for match in matches:
-                            article_id = match.strip()
-                            if article_id in id_mapping:
-                                filtered_ids.append(id_mapping[article_id])
+                filtered_ids = numeric_ids
             
             if not filtered_ids:
                 self.logger.warning("No articles were filtered from the response")
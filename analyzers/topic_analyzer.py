@@ -1,8 +1,10 @@
+import asyncio
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
-from utils import setup_logger, get_config_loader, FileManager
+from utils import setup_logger, FileManager
 from models import Topic, TopicStats, NewsArticle
+from analyzers.context import AnalyzerContext
 from analyzers.topic_modeler import TopicModeler
 from analyzers.topic_selector import TopicSelector
 
@@ -11,22 +13,24 @@ from analyzers.topic_selector import TopicSelector
 class TopicAnalyzer:
     """Topic analyzer, coordinates the topic analysis process"""
     
-    def __init__(self, region: str, date: str):
+    def __init__(self, region: str, date: str, ctx: Optional[AnalyzerContext] = None):
         """
         Initialize topic analyzer
         
         :param region: Region code
         :param date: Date string (YYYYMMDD)
+        :param ctx: Shared analyzer services, created if not provided
         """
         self.region = region
         self.date = date
         self.logger = setup_logger("Topic Analyzer")
         
         # Initialize services and tools
-        self.config_loader = get_config_loader()
+        ctx = ctx or AnalyzerContext.create()
+        self.config_loader = ctx.config
         self.file_manager = FileManager()
         self.topic_modeler = TopicModeler(region=region)
-        self.topic_selector = TopicSelector(region=region, date=date)
+        self.topic_selector = TopicSelector(region=region, date=date, ctx=ctx)
         
         self.logger.info(f"Initialized TopicAnalyzer for {region} on {date}")
     
@@ -55,7 +59,10 @@ class TopicAnalyzer:
             topics_stats = TopicStats.from_dict(topics_data_dict)
             
             # Save topic data (still using dictionary format to ensure backward compatibility)
-            self.file_manager.save_topics(topics_data_dict, self.region, self.date)
+            # in a worker thread so the event loop isn't blocked on disk I/O
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.file_manager.save_topics, topics_data_dict, self.region, self.date
+            )
             
             self.logger.info(f"Saved {len(topics_stats.topics)} topics")
             
@@ -79,19 +86,21 @@ class TopicAnalyzer:
             
             self.logger.info(f"Selecting topics from {len(topics_stats.topics)} candidates")
             
-            # Convert Topic objects to dictionaries for compatibility with selector
-            topics_dicts = [topic.to_dict() for topic in topics_stats.topics]
+            # Use topic selector to make selection (Topic objects are returned as-is)
+            selected = await self.topic_selector.select_topics(topics_stats.topics)
             
-            # Use topic selector to make selection (still using dictionary format)
-            selected_topics_dicts = await self.topic_selector.select_topics(topics_dicts)
-            
-            # Convert back to Topic objects
+            # Convert any dictionary results back to Topic objects
+            id_index = {topic.topic_id: topic for topic in topics_stats.topics}
             selected_topics = []
-            for topic_dict in selected_topics_dicts:
+            for topic_dict in selected:
+                if isinstance(topic_dict, Topic):
+                    selected_topics.append(topic_dict)
+                    continue
+                
                 topic_id = topic_dict.get('topic_id')
                 if topic_id is not None:
                     # Look for complete topic information in the original topic list
-                    original_topic = topics_stats.get_topic_by_id(int(topic_id))
+                    original_topic = id_index.get(int(topic_id))
                     if original_topic:
                         # Set selection reason
                         original_topic.selection_reason = topic_dict.get('selection_reason', '')
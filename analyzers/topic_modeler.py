@@ -1,18 +1,20 @@
 # Standard library imports
+import asyncio
 import os
 import re
 import math
-from collections import Counter
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Union, Tuple, FrozenSet, Optional
 
 # Third-party library imports
 import jieba
 import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
 from gensim import corpora, models
 from sklearn.feature_extraction.text import TfidfVectorizer
-import nltk
-from nltk.tokenize import word_tokenize
+from sklearn.cluster import MiniBatchKMeans
 import pyvi
 from pyvi import ViTokenizer
 
@@ -21,6 +23,135 @@ from utils import setup_logger, get_config_loader
 from models import NewsArticle
 
 
+logger = setup_logger("Topic Modeler")
+
+# Punctuation, special characters and digits are replaced in one pass
+_RE_NONWORD_OR_DIGITS = re.compile(r'[^\w\s]|\d+')
+_RE_WS = re.compile(r'\s+')
+_RE_WORD = re.compile(r'\w+')
+
+
+@lru_cache(maxsize=50_000)
+def _tokenize(text: str, region: str) -> Tuple[str, ...]:
+    """
+    Clean and tokenize text according to region
+    
+    Memoized so repeated texts (e.g. wire-service copies) are only segmented once.
+    
+    :param text: Original text
+    :param region: Region code
+    :return: Tuple of tokens (hashable, so it can be cached)
+    """
+    # Remove punctuation, special characters and digits
+    text = _RE_NONWORD_OR_DIGITS.sub(' ', text)
+    text = _RE_WS.sub(' ', text)
+    text = text.strip().lower()
+    if not text:
+        return ()
+    
+    # Tokenize according to region
+    if region == 'tw':
+        # Chinese tokenization
+        tokens = jieba.cut(text)
+    elif region == 'vt':
+        # Vietnamese tokenization
+        try:
+            text = ViTokenizer.tokenize(text)
+            tokens = text.split()
+        except Exception as e:
+            logger.error(f"Error in Vietnamese tokenization: {str(e)}")
+            tokens = text.split()
+    elif region == 'us':
+        # English tokenization (text is already lowercased and punctuation-free)
+        tokens = _RE_WORD.findall(text)
+    else:
+        # Other regions tokenize by space
+        tokens = text.split()
+    
+    return tuple(tokens)
+
+
+_jieba_configured = False
+_loaded_user_dicts = set()
+
+
+def _configure_jieba() -> None:
+    """Set the jieba cache directory once per process"""
+    global _jieba_configured
+    if _jieba_configured:
+        return
+    jieba_cache_dir = Path("data/temp/jieba_cache")
+    jieba_cache_dir.mkdir(parents=True, exist_ok=True)
+    jieba.dt.tmp_dir = str(jieba_cache_dir)
+    _jieba_configured = True
+
+
+def _load_jieba_userdict(dict_path: str) -> bool:
+    """
+    Load a jieba user dictionary once per process
+    
+    :param dict_path: Path of the user dictionary
+    :return: True if the dictionary was loaded by this call
+    """
+    if dict_path in _loaded_user_dicts:
+        return False
+    jieba.load_userdict(dict_path)
+    _loaded_user_dicts.add(dict_path)
+    return True
+
+
+def _preprocess_standalone(text: str, region: str, stopwords: FrozenSet[str]) -> List[str]:
+    """
+    Tokenize text and filter stopwords
+    
+    :param text: Original text
+    :param region: Region code
+    :param stopwords: Stopwords to drop
+    :return: List of processed tokens
+    """
+    # Tokenize (memoized per region and text)
+    tokens = _tokenize(text, region)
+    
+    # Filter stopwords (whitespace and digits are already removed by the cleanup regexes)
+    return [token for token in tokens if len(token) > 1 and token not in stopwords]
+
+
+def _preprocess_batch(texts: List[str], region: str, stopwords: FrozenSet[str],
+                      user_dict: Optional[str] = None) -> List[List[str]]:
+    """
+    Preprocess a batch of texts in a worker process
+    
+    :param texts: Original texts
+    :param region: Region code
+    :param stopwords: Stopwords to drop
+    :param user_dict: Optional jieba user dictionary, loaded once per worker
+    :return: List of processed tokens for each text
+    """
+    if user_dict:
+        _load_jieba_userdict(user_dict)
+    return [_preprocess_standalone(text, region, stopwords) for text in texts]
+
+
+def _identity_analyzer(tokens: List[str]) -> List[str]:
+    """Analyzer for TfidfVectorizer on already tokenized documents"""
+    return tokens
+
+
+class _BoWCorpus:
+    """Reiterable bag-of-words corpus streamed from preprocessed documents"""
+    
+    def __init__(self, dictionary: corpora.Dictionary, processed_docs: List[List[str]]):
+        self.dictionary = dictionary
+        self.processed_docs = processed_docs
+    
+    def __iter__(self):
+        for doc in self.processed_docs:
+            yield self.dictionary.doc2bow(doc)
+    
+    def __len__(self) -> int:
+        return len(self.processed_docs)
+
+
 class TopicModeler:
     """Topic modeling tool, responsible for text processing and topic modeling"""
     
@@ -38,7 +169,7 @@ class TopicModeler:
         self.region_info = self.config_loader.get_region_info(region)
         
         # Set stopwords and weights
-        self.stopwords = set(self.region_info.get('stopwords', []))
+        self.stopwords = frozenset(self.region_info.get('stopwords', []))
         self.weighted_sources = self.region_info.get('weighted_sources', {})
         self.main_language = self.region_info.get('main_language', 'eng')
         
@@ -48,26 +179,27 @@ class TopicModeler:
         self.topic_counter = Counter()
         self.weighted_topic_counter = Counter() 
         
+        # Dictionary and bag-of-words corpus of the last LDA run
+        self.dictionary = None
+        self._last_corpus = None
+        
+        # Parallel preprocessing settings
+        topic_config = self.config_loader.get_topic_analysis_config()
+        self.n_jobs = topic_config.get('n_jobs', -1)
+        self.parallel_min_docs = topic_config.get('parallel_min_docs', 500)
+        self.user_dict = None
+        
         # Set jieba cache directory (only needed when processing Chinese)
         if self.region == 'tw':
-            jieba_cache_dir = Path("data/temp/jieba_cache")
-            jieba_cache_dir.mkdir(parents=True, exist_ok=True)
-            jieba.dt.tmp_dir = str(jieba_cache_dir)
+            _configure_jieba()
             
             # If there's a custom dictionary, load it
             custom_dict_path = self.region_info.get('jieba_dict_path')
             if custom_dict_path and os.path.exists(custom_dict_path):
-                jieba.load_userdict(custom_dict_path)
-                self.logger.info(f"Loaded custom dictionary for jieba: {custom_dict_path}")
-        
-        # Download NLTK data for English tokenization
-        if self.region == 'us':
-            try:
-                nltk.download('punkt', quiet=True)
-                self.logger.info("NLTK punkt tokenizer downloaded successfully")
-            except Exception as e:
-                self.logger.error(f"Failed to download NLTK data: {str(e)}")
-                
+                self.user_dict = custom_dict_path
+                if _load_jieba_userdict(custom_dict_path):
+                    self.logger.info(f"Loaded custom dictionary for jieba: {custom_dict_path}")
+        
         self.logger.info(f"Initialized TopicModeler for region: {region}")
     
     def preprocess(self, text: str) -> List[str]:
@@ -77,82 +209,76 @@ class TopicModeler:
         :param text: Original text
         :return: List of processed tokens
         """
-        # Remove punctuation and special characters
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\d+', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip().lower()
+        return _preprocess_standalone(text, self.region, self.stopwords)
+    
+    def preprocess_many(self, texts: List[str]) -> List[List[str]]:
+        """
+        Preprocess texts, in parallel worker processes for large batches
         
-        # Tokenize according to region
-        if self.region == 'tw':
-            # Chinese tokenization
-            tokens = jieba.cut(text)
-        elif self.region == 'vt':
-            # Vietnamese tokenization
-            try:
-                text = ViTokenizer.tokenize(text)
-                tokens = text.split()
-            except Exception as e:
-                self.logger.error(f"Error in Vietnamese tokenization: {str(e)}")
-                tokens = text.split()
-        elif self.region == 'us':
-            # English tokenization
-            try:
-                tokens = word_tokenize(text)
-            except Exception as e:
-                self.logger.error(f"Error in English tokenization: {str(e)}")
-                tokens = text.split()
-        else:
-            # Other regions tokenize by space
-            tokens = text.split()
-            
-        # Filter stopwords
-        processed_tokens = [
-            token for token in tokens 
-            if token not in self.stopwords 
-            and len(token) > 1 
-            and not token.isspace()
-            and not token.isdigit()
-        ]
+        Tokenization is pure Python/CPU work that holds the GIL, so processes
+        are used instead of threads.
         
-        return processed_tokens
+        :param texts: Original texts
+        :return: List of processed tokens for each text
+        """
+        if self.n_jobs == 1 or len(texts) < self.parallel_min_docs:
+            return [self.preprocess(text) for text in texts]
+        
+        # One batch per worker call amortizes process startup and stopword pickling
+        batch_size = max(1, math.ceil(len(texts) / (effective_n_jobs(self.n_jobs) * 4)))
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        try:
+            results = Parallel(n_jobs=self.n_jobs, backend="loky")(
+                delayed(_preprocess_batch)(batch, self.region, self.stopwords, self.user_dict)
+                for batch in batches
+            )
+        except Exception as e:
+            self.logger.warning(f"Parallel preprocessing failed, falling back to serial: {str(e)}")
+            return [self.preprocess(text) for text in texts]
+        
+        return [tokens for batch in results for tokens in batch]
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the tokenization cache (for long-running processes)"""
+        _tokenize.cache_clear()
     
     async def perform_topic_modeling(self, news_list: List[Union[Dict, NewsArticle]]) -> Dict[str, Any]:
         """
-        Perform topic modeling
+        Perform topic modeling in a worker thread, so other regions keep running on the event loop
+        
+        :param news_list: News list (can be NewsArticle objects or dictionaries; dictionaries
+                          get their topics written to the "topics" key)
+        :return: Topic data {"topics": [...]}
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self._model_topics, news_list)
+    
+    def _model_topics(self, news_list: List[Union[Dict, NewsArticle]]) -> Dict[str, Any]:
+        """
+        Preprocess documents and fit the topic model, CPU-bound work run off the event loop
         
-        :param news_list: News list (can be NewsArticle objects or dictionaries)
+        :param news_list: News list (NewsArticle objects or dictionaries)
         :return: Topic data {"topics": [...]}
         """
         try:
             self.logger.info(f"Starting topic modeling for {len(news_list)} news articles")
             
-            # Extract text and keep track of article IDs
-            documents = []
-            article_ids = []
-            for news in news_list:
-                # Handle different types of input
-                if isinstance(news, NewsArticle):
-                    article_id = news.id
-                    summary = news.summary or ""
-                    if not summary:
-                        title = news.title or ""
-                        content = news.content[:500] if news.content else ""
-                        summary = f"{title} {content}"
-                else:
-                    article_id = news.get("_id")
-                    summary = news.get("summary", "")
-                    if not summary:
-                        title = news.get("title", "")
-                        content = news.get("content", "")[:500]
-                        summary = f"{title} {content}"
-                
-                documents.append(summary)
-                article_ids.append(article_id)
+            # Normalize input once, then work on parallel arrays of IDs, texts and sources
+            articles = [news if isinstance(news, NewsArticle) else NewsArticle.from_dict(news) for news in news_list]
+            article_ids = [article.id for article in articles]
+            documents = [article.summary or article.title for article in articles]
+            article_sources = [article.source for article in articles]
             
-            # Preprocess documents
-            processed_docs = [self.preprocess(doc) for doc in documents]
-            processed_docs = [doc for doc in processed_docs if doc]
+            # Preprocess documents once, keeping IDs and sources aligned with the valid documents
+            processed_docs = []
+            valid_ids = []
+            valid_sources = []
+            for tokens, article_id, source in zip(self.preprocess_many(documents), article_ids, article_sources):
+                if tokens:
+                    processed_docs.append(tokens)
+                    valid_ids.append(article_id)
+                    valid_sources.append(source)
+            article_ids = valid_ids
             
             if not processed_docs:
                 self.logger.warning("No valid documents after preprocessing")
@@ -160,11 +286,6 @@ class TopicModeler:
             
             self.logger.info(f"Preprocessed {len(processed_docs)} valid documents")
             
-            # Build dictionary and corpus
-            dictionary = corpora.Dictionary(processed_docs)
-            dictionary.filter_extremes(no_below=2, no_above=0.9)
-            corpus = [dictionary.doc2bow(doc) for doc in processed_docs]
-            
             # Set number of topics
             topic_config = self.config_loader.get_topic_analysis_config()
             num_topics = self._adjust_num_topics(
@@ -173,61 +294,42 @@ class TopicModeler:
                 max_topics=topic_config.get('max_topics', 20)
             )
             
-            self.logger.info(f"Training LDA model with {num_topics} topics")
+            # Fit topic model and get keywords per topic and topic distribution per document
+            method = topic_config.get('method', 'kmeans')
+            if method == 'lda':
+                topic_keywords, doc_topics_list = self._fit_lda(processed_docs, num_topics)
+            else:
+                topic_keywords, doc_topics_list = self._fit_kmeans(processed_docs, num_topics)
+            num_topics = len(topic_keywords)
             
-            # Set LDA model parameters
-            model_params = {
-                'corpus': corpus,
-                'id2word': dictionary,
-                'num_topics': num_topics,
-                'passes': 15,
-                'alpha': 'symmetric',
-                'eta': 'symmetric',
-                'random_state': 42,
-                'minimum_probability': 0.01
-            }
+            # Dense doc-topic matrix, shared by topic counting and assignment
+            doc_topic = np.zeros((len(doc_topics_list), num_topics), dtype=np.float32)
+            for idx, doc_topics in enumerate(doc_topics_list):
+                for t_id, prob in doc_topics:
+                    doc_topic[idx, t_id] = prob
             
-            if self.region == 'vt':
-                model_params.update({
-                    'iterations': 100,
-                    'passes': 20,
-                    'minimum_probability': 0.05,
-                    'decay': 0.5
-                })
+            # Calculate topic distribution and weights
+            self._update_topic_counts(valid_sources, doc_topic, processed_docs)
             
-            # Create LDA model
-            lda_model = models.LdaModel(**model_params)
+            mask = doc_topic >= 0.3  # 主題機率閾值
             
-            # Calculate topic distribution and weights
-            self._update_topic_counts(news_list, dictionary, lda_model)
+            # 用於追蹤每篇文章的主題分配 (keywords live on the topic record only)
+            article_topic_mapping = defaultdict(list)
+            for idx, topic_id in np.argwhere(mask):
+                article_topic_mapping[article_ids[idx]].append({
+                    'topic_id': int(topic_id),
+                    'probability': float(doc_topic[idx, topic_id])
+                })
             
             # Generate topic list with article assignments
             topics = []
-            article_topic_mapping = {}  # 用於追蹤每篇文章的主題分配
-            
             for topic_id in range(num_topics):
                 try:
                     # Get topic terms
-                    topic_terms = lda_model.get_topic_terms(topic_id, topn=5)
-                    keywords = [dictionary[term_id] for term_id, _ in topic_terms]
+                    keywords = topic_keywords[topic_id]
                     
                     # Get articles for this topic
-                    topic_articles = []
-                    
-                    # Process each document's topic distribution
-                    for idx, doc_topics in enumerate(lda_model[corpus]):
-                        article_id = article_ids[idx]
-                        for t_id, prob in doc_topics:
-                            if t_id == topic_id and prob >= 0.3:  # 主題機率閾值
-                                topic_articles.append(article_id)
-                                # 將主題資訊加入文章的映射中
-                                if article_id not in article_topic_mapping:
-                                    article_topic_mapping[article_id] = []
-                                article_topic_mapping[article_id].append({
-                                    'topic_id': topic_id,
-                                    'probability': float(prob),
-                                    'keywords': keywords
-                                })
+                    topic_articles = [article_ids[i] for i in np.flatnonzero(mask[:, topic_id])]
                     
                     # Create topic entry
                     content = " + ".join(f'"{keyword}"' for keyword in keywords)
@@ -250,14 +352,13 @@ class TopicModeler:
             # Sort topics by weighted count
             topics = sorted(topics, key=lambda x: x['weighted_count'], reverse=True)
             
-            # Update news articles with their topics
-            for news in news_list:
-                article_id = news.id if isinstance(news, NewsArticle) else news.get("_id")
-                if article_id in article_topic_mapping:
-                    if isinstance(news, NewsArticle):
-                        news.topics = article_topic_mapping[article_id]
+            # Update news articles with their topics (dictionary inputs get them too, not just the converted copies)
+            for news, article in zip(news_list, articles):
+                if article.id in article_topic_mapping:
+                    if news is article:
+                        article.topics = article_topic_mapping[article.id]
                     else:
-                        news["topics"] = article_topic_mapping[article_id]
+                        news["topics"] = article_topic_mapping[article.id]
             
             self.logger.info(f"Topic modeling completed, found {len(topics)} topics")
             return {"topics": topics}
@@ -266,13 +367,101 @@ class TopicModeler:
             self.logger.error(f"Error in topic modeling: {str(e)}")
             return {"topics": []}
     
-    def _update_topic_counts(self, news_list: List[Union[Dict, NewsArticle]], dictionary, lda_model):
+    def _fit_lda(self, processed_docs: List[List[str]], num_topics: int) -> Tuple[List[List[str]], List[List[Tuple[int, float]]]]:
+        """
+        Fit a gensim LDA model
+        
+        :param processed_docs: Preprocessed tokens of each document
+        :param num_topics: Number of topics
+        :return: (top keywords of each topic, topic distribution [(topic_id, prob), ...] of each document)
+        """
+        # Build dictionary once; the corpus is streamed so bag-of-words lists are never all held in memory
+        dictionary = corpora.Dictionary(processed_docs)
+        dictionary.filter_extremes(no_below=2, no_above=0.9)
+        corpus = _BoWCorpus(dictionary, processed_docs)
+        self.dictionary = dictionary
+        self._last_corpus = corpus
+        
+        self.logger.info(f"Training LDA model with {num_topics} topics")
+        
+        # Set LDA model parameters
+        model_params = {
+            'corpus': corpus,
+            'id2word': dictionary,
+            'num_topics': num_topics,
+            'passes': 15,
+            'alpha': 'symmetric',
+            'eta': 'symmetric',
+            'random_state': 42,
+            'minimum_probability': 0.01
+        }
+        
+        if self.region == 'vt':
+            model_params.update({
+                'iterations': 100,
+                'passes': 20,
+                'minimum_probability': 0.05,
+                'decay': 0.5
+            })
+        
+        # Create LDA model
+        lda_model = models.LdaModel(**model_params)
+        
+        topic_keywords = [
+            [dictionary[term_id] for term_id, _ in lda_model.get_topic_terms(topic_id, topn=5)]
+            for topic_id in range(num_topics)
+        ]
+        
+        # Infer the topic distribution of each document once (consumed into the dense matrix downstream)
+        doc_topics_list = list(lda_model[corpus])
+        
+        return topic_keywords, doc_topics_list
+    
+    def _fit_kmeans(self, processed_docs: List[List[str]], num_topics: int) -> Tuple[List[List[str]], List[List[Tuple[int, float]]]]:
+        """
+        Cluster TF-IDF document vectors with MiniBatchKMeans
+        
+        Each document is assigned to its nearest cluster, with probability
+        1 - (distance to its center / distance to the farthest center).
+        
+        :param processed_docs: Preprocessed tokens of each document
+        :param num_topics: Number of topics
+        :return: (top keywords of each topic, topic distribution [(topic_id, prob), ...] of each document)
+        """
+        # Documents are already tokenized, so pass the tokens straight through
+        try:
+            vectorizer = TfidfVectorizer(analyzer=_identity_analyzer, min_df=2, max_df=0.9)
+            X = vectorizer.fit_transform(processed_docs)
+        except ValueError:
+            # Too few documents for the document frequency limits
+            vectorizer = TfidfVectorizer(analyzer=_identity_analyzer)
+            X = vectorizer.fit_transform(processed_docs)
+        
+        num_topics = min(num_topics, X.shape[0])
+        self.logger.info(f"Clustering {X.shape[0]} documents into {num_topics} topics")
+        
+        kmeans = MiniBatchKMeans(n_clusters=num_topics, batch_size=1024, n_init=3, random_state=42)
+        labels = kmeans.fit_predict(X)
+        
+        terms = vectorizer.get_feature_names_out()
+        top_terms = np.argsort(kmeans.cluster_centers_, axis=1)[:, ::-1][:, :5]
+        topic_keywords = [[str(terms[i]) for i in row] for row in top_terms]
+        
+        distances = kmeans.transform(X)
+        max_distances = distances.max(axis=1)
+        max_distances[max_distances == 0] = 1.0
+        probs = 1.0 - distances[np.arange(len(labels)), labels] / max_distances
+        doc_topics_list = [[(int(label), float(prob))] for label, prob in zip(labels, probs)]
+        
+        return topic_keywords, doc_topics_list
+    
+    def _update_topic_counts(self, article_sources: List[str], doc_topic: np.ndarray, tokens_list: List[List[str]]):
         """
         Update topic and keyword counts
         
-        :param news_list: News list (can be NewsArticle objects or dictionaries)
-        :param dictionary: Dictionary
-        :param lda_model: LDA model
+        :param article_sources: Source of each document
+        :param doc_topic: Dense doc-topic probability matrix of shape (n_docs, num_topics)
+        :param tokens_list: Preprocessed tokens of each document
         """
         # Reset counters
         self.topic_counter.clear()
@@ -280,44 +469,30 @@ class TopicModeler:
         self.keyword_counter.clear()
         self.weighted_keyword_counter.clear()
         
-        for article in news_list:
-            # Handle different types of input
-            if isinstance(article, NewsArticle):
-                # Handle NewsArticle object
-                summary = article.summary or ""
-                if not summary:
-                    title = article.title or ""
-                    content = article.content[:500] if article.content else ""  # Limit content length
-                    summary = f"{title} {content}"
-                source = article.source
-            else:
-                # Handle dictionary
-                summary = article.get("summary", "")
-                if not summary:
-                    title = article.get("title", "")
-                    content = article.get("content", "")[:500]  # Limit content length
-                    summary = f"{title} {content}"
-                source = article.get("source", "")
-            
-            # Process article to get topic allocation
-            tokens = self.preprocess(summary)
-            if not tokens:
-                continue
-                
-            bow = dictionary.doc2bow(tokens)
-            article_topics = lda_model.get_document_topics(bow)
-            
-            # Update topic counter
+        # Source weight of each document, aligned with the doc-topic rows
+        weights = np.fromiter(
+            (self.weighted_sources.get(source, 1.0) for source in article_sources),
+            dtype=np.float32,
+            count=len(article_sources)
+        )
+        
+        # Update topic counter, only considering topics with probability greater than 0.1
+        counted = doc_topic * (doc_topic >= 0.1)
+        topic_counts = np.count_nonzero(counted, axis=0)
+        weighted_topic_counts = weights @ counted.astype(np.float64)
+        for topic_id in np.flatnonzero(topic_counts):
+            self.topic_counter[int(topic_id)] = int(topic_counts[topic_id])
+            self.weighted_topic_counter[int(topic_id)] = float(weighted_topic_counts[topic_id])
+        
+        # Update keyword counter once per source, so each source weight is applied once per token
+        tokens_by_source = defaultdict(list)
+        for source, tokens in zip(article_sources, tokens_list):
+            tokens_by_source[source].extend(tokens)
+        for source, tokens in tokens_by_source.items():
             weight = self.weighted_sources.get(source, 1.0)
-            for topic_id, prob in article_topics:
-                if prob >= 0.1:  # Only consider topics with probability greater than 0.1
-                    self.topic_counter[topic_id] += 1
-                    self.weighted_topic_counter[topic_id] += weight * prob
-            
-            # Update keyword counter
-            for token in tokens:
-                self.keyword_counter[token] += 1
-                self.weighted_keyword_counter[token] += weight
+            token_counts = Counter(tokens)
+            self.keyword_counter.update(token_counts)
+            self.weighted_keyword_counter.update({token: count * weight for token, count in token_counts.items()})
     
     def _adjust_num_topics(self, article_count: int, min_topics: int = 5, max_topics: int = 20) -> int:
         """
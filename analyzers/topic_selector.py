@@ -1,38 +1,75 @@
-import json
-from typing import Dict, List, Any
+import re
+from typing import Dict, List, Any, Optional, Union
 
-from services import LLMService, PromptService, PromptCategory
+import orjson
+
+from services import PromptCategory
 from utils import setup_logger
+from models import Topic
+from analyzers.context import AnalyzerContext
+
+
+# Topic fields the LLM needs to judge a topic (article IDs are internal and only add tokens)
+_PROMPT_FIELDS = ('topic_id', 'content', 'count', 'weighted_count')
+
+# Fallback "Topic ID: 235, Reason: ..." lines of the legacy response format
+_TOPIC_RE = re.compile(r'^\s*Topic ID:\s*(\S+?)\s*(?:,\s*(?:Reason:\s*)?(.*))?$', re.MULTILINE)
+
+# Structured output schema for topic selection: {"selected_topics": [{"topic_id": "...", "reason": "..."}]}
+_TOPIC_SELECTION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "topic_selection",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "selected_topics": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "topic_id": {"type": "string"},
+                            "reason": {"type": "string"}
+                        },
+                        "required": ["topic_id", "reason"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["selected_topics"],
+            "additionalProperties": False
+        }
+    }
+}
 
 
 class TopicSelector:
     """Select the most suitable topics for report generation"""
     
-    def __init__(self, region: str, date: str):
+    def __init__(self, region: str, date: str, ctx: Optional[AnalyzerContext] = None):
         """
         Initialize topic selector
         
         :param region: Region code
         :param date: Date string (YYYYMMDD)
+        :param ctx: Shared analyzer services, created if not provided
         """
         self.region = region
         self.date = date
         self.logger = setup_logger("Topic Selector")
         
         # Initialize services
-        self.llm_service = LLMService(
-            temperature=0,
-            model_name="gpt-4o",
-            region=region
-        )
-        self.prompt_service = PromptService()
+        ctx = ctx or AnalyzerContext.create()
+        self.llm_service = ctx.llm
+        self.prompt_service = ctx.prompts
     
-    async def select_topics(self, topics_data: List[Dict]) -> List[Dict]:
+    async def select_topics(self, topics_data: List[Union[Dict, Topic]]) -> List[Union[Dict, Topic]]:
         """
         Select the most suitable topics for report generation
         
-        :param topics_data: List of topic data
-        :return: List of selected topics
+        :param topics_data: List of topic data (Topic objects or dictionaries)
+        :return: List of selected topics, Topic objects are returned as-is with selection_reason set
         """
         self.logger.info("Selecting top topics")
         
@@ -44,7 +81,10 @@ class TopicSelector:
         user_prompt = self.prompt_service.get_prompt(
             category=PromptCategory.TOPIC_SELECTION,
             prompt_name="user",
-            topics_data=json.dumps(topics_data, ensure_ascii=False)
+            topics_data=orjson.dumps([
+                {field: data[field] for field in _PROMPT_FIELDS if field in data}
+                for data in (topic.to_dict() if isinstance(topic, Topic) else topic for topic in topics_data)
+            ]).decode('utf-8')
         )
         
         self.logger.debug(f"System Prompt: {system_prompt}")
@@ -52,7 +92,8 @@ class TopicSelector:
         
         response = await self.llm_service.chat(
             system_prompt=system_prompt,
-            user_prompt=user_prompt
+            user_prompt=user_prompt,
+            response_format=_TOPIC_SELECTION_RESPONSE_FORMAT
         )
 
         self.logger.debug(f"Response: {response}")
@@ -63,48 +104,52 @@ class TopicSelector:
         
         return selected_topics
     
-    def _parse_topic_selection(self, response: str, topics_data: List[Dict]) -> List[Dict]:
+    def _parse_topic_selection(self, response: str, topics_data: List[Union[Dict, Topic]]) -> List[Union[Dict, Topic]]:
         """
         Parse topic selection response
         
         :param response: LLM response
-        :param topics_data: Original topic data
+        :param topics_data: Original topic data (Topic objects or dictionaries)
         :return: List of selected topics
         """
         selected_topics = []
         try:
-            lines = response.split('\n')
-            current_topic = None
+            # Index topics once for O(1) lookup per selection
+            topic_index = {str(self._get_topic_id(topic)): topic for topic in topics_data}
             
-            for line in lines:
-                if line.startswith('Topic ID:'):
-                    if current_topic:
-                        selected_topics.append(current_topic)
-                    
-                    # Extract topic ID and reason
-                    parts = line.split(',', 1)
-                    topic_id = parts[0].replace('Topic ID:', '').strip()
-                    reason = parts[1].replace('Reason:', '').strip() if len(parts) > 1 else ''
-                    
-                    # Find corresponding topic data
-                    topic_data = next(
-                        (topic for topic in topics_data if str(topic.get('topic_id')) == topic_id),
-                        None
-                    )
-                    
-                    if topic_data:
-                        current_topic = {
-                            **topic_data,
-                            'selection_reason': reason
-                        }
+            # Structured output: {"selected_topics": [{"topic_id": "...", "reason": "..."}]}
+            try:
+                selections = [
+                    (str(selection.get('topic_id', '')).strip(), str(selection.get('reason', '')).strip())
+                    for selection in orjson.loads(response)['selected_topics']
+                ]
+            except (orjson.JSONDecodeError, KeyError, TypeError, AttributeError):
+                # Fall back to the "Topic ID: ..., Reason: ..." line format
+                selections = [
+                    (match.group(1), (match.group(2) or '').strip())
+                    for match in _TOPIC_RE.finditer(response)
+                ]
             
-            # Add the last topic
-            if current_topic:
-                selected_topics.append(current_topic)
+            for topic_id, reason in selections:
+                topic_data = topic_index.get(topic_id)
+                if isinstance(topic_data, Topic):
+                    topic_data.selection_reason = reason
+                    selected_topics.append(topic_data)
+                elif topic_data:
+                    selected_topics.append({**topic_data, 'selection_reason': reason})
                 
             return selected_topics[:5]  # Ensure only 5 topics are returned
             
-            
         except Exception as e:
             self.logger.error(f"Error parsing topic selection: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+    
+    @staticmethod
+    def _get_topic_id(topic: Union[Dict, Topic]) -> Any:
+        """
+        Get topic ID from a Topic object or dictionary
+        
+        :param topic: Topic data
+        :return: Topic ID
+        """
+        return topic.topic_id if isinstance(topic, Topic) else topic.get('topic_id')
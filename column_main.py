@@ -1,18 +1,64 @@
 import asyncio
 import click
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple
 import sys
 from pathlib import Path
 
 from reporting import BaseReportGenerator
 from runners import NewsReportBaseRunner
+from analyzers import AnalyzerContext
 from utils import setup_logger, get_config_loader
 
 
 logger = setup_logger("Main")
 
 
+async def _run_region(
+    region: str,
+    date: Optional[str],
+    ctx: AnalyzerContext,
+    semaphore: asyncio.Semaphore
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Execute report generation for one region
+    
+    :param region: Region code
+    :param date: Specified date (YYYYMMDD)
+    :param ctx: Shared analyzer services
+    :param semaphore: Limits how many regions run at once
+    :return: (region, result summary)
+    """
+    async with semaphore:
+        logger.info(f"Processing region: {region}")
+        try:
+            # Use NewsReportBaseRunner to generate reports
+            runner = NewsReportBaseRunner(
+                region=region,
+                date=date,
+                ctx=ctx
+            )
+            
+            # Execute report generation
+            result = await runner.run()
+            
+            logger.info(f"Generated {len(result.get('global_reports', []))} global reports for {region}")
+            
+            # Record results
+            return region, {
+                "successful": True,
+                "global_reports_count": len(result.get("global_reports", [])),
+                "execution_time": result.get("execution_time", 0)
+            }
+            
+        except Exception as e:
+            logger.error(f"Error generating reports for {region}: {str(e)}")
+            return region, {
+                "successful": False,
+                "errors": [str(e)]
+            }
+
+
 async def run_pipeline(
     regions: List[str],
     date: Optional[str] = None
@@ -27,36 +73,17 @@ async def run_pipeline(
         logger.info(f"Starting report generation, date: {date or 'today'}, regions: {', '.join(regions)}")
         start_time = datetime.now()
         
-        results = {}
+        # Share LLM/prompt/config services across all regions
+        ctx = AnalyzerContext.create()
         
-        # Generate reports for each region
-        for region in regions:
-            logger.info(f"Processing region: {region}")
-            try:
-                # Use NewsReportBaseRunner to generate reports
-                runner = NewsReportBaseRunner(
-                    region=region,
-                    date=date
-                )
-                
-                # Execute report generation
-                result = await runner.run()
-                
-                # Record results
-                results[region] = {
-                    "successful": True,
-                    "global_reports_count": len(result.get("global_reports", [])),
-                    "execution_time": result.get("execution_time", 0)
-                }
-                
-                logger.info(f"Generated {len(result.get('global_reports', []))} global reports for {region}")
-                
-            except Exception as e:
-                logger.error(f"Error generating reports for {region}: {str(e)}")
-                results[region] = {
-                    "successful": False,
-                    "errors": [str(e)]
-                }
+        # Generate reports for all regions concurrently, LLM calls are still
+        # bounded by the shared LLMService semaphore and rate limiter
+        system_config = get_config_loader().get_system_config()
+        semaphore = asyncio.Semaphore(system_config.get('max_concurrent_regions', len(regions)) or 1)
+        region_results = await asyncio.gather(
+            *(_run_region(region, date, ctx, semaphore) for region in regions)
+        )
+        results = dict(region_results)
         
         # Display execution time
         execution_time = (datetime.now() - start_time).total_seconds()
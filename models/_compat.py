@@ -0,0 +1,4 @@
+import sys
+
+# dataclass(slots=True) is only available on Python 3.10+; older versions keep a per-instance __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
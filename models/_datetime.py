@@ -0,0 +1,43 @@
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Union
+
+# Python 3.11+ fromisoformat parses most ISO 8601 strings, including a trailing 'Z'
+_NATIVE_ISO = sys.version_info >= (3, 11)
+
+
+@lru_cache(maxsize=8192)
+def _parse_datetime_str(dt_value: str) -> Union[datetime, str]:
+    """Parse a datetime string, memoized since feeds repeat timestamps heavily
+
+    :param dt_value: Datetime string in various formats
+    :return: Parsed datetime object or original string if parsing fails
+    """
+    if _NATIVE_ISO:
+        try:
+            return datetime.fromisoformat(dt_value)
+        except ValueError:
+            pass
+
+    try:
+        if 'T' in dt_value:
+            return datetime.fromisoformat(dt_value.replace('Z', '+00:00'))
+        else:
+            return datetime.strptime(dt_value, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        try:
+            return datetime.strptime(dt_value, '%Y-%m-%d %H:%M:%S %Z')
+        except ValueError:
+            return dt_value
+
+
+def parse_datetime(dt_value: Any) -> Any:
+    """Parse datetime value
+
+    :param dt_value: Datetime value in various formats
+    :return: Parsed datetime object or original value if parsing fails
+    """
+    if isinstance(dt_value, str):
+        return _parse_datetime_str(dt_value)
+    return dt_value
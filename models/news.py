@@ -2,7 +2,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 
-@dataclass
+from models._compat import DATACLASS_SLOTS
+from models._datetime import parse_datetime
+
+@dataclass(eq=False, **DATACLASS_SLOTS)
 class NewsArticle:
     """Data model for news articles, used to unify the structure of news data"""
     
@@ -17,6 +20,7 @@ class NewsArticle:
     
     # Analysis results
     topics: List[Dict[str, Any]] = field(default_factory=list)  # List [{"topic_id": id, "probability": prob}, ...]
+    embedding: Optional[Any] = field(default=None, repr=False, compare=False)  # Title + summary embedding (np.ndarray), not serialized
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'NewsArticle':
@@ -25,31 +29,33 @@ class NewsArticle:
         :param data: Dictionary containing news article data
         :return: NewsArticle instance
         """
+        get = data.get
+        
         # Handle ID
-        article_id = None
-        if '_id' in data:
-            if isinstance(data['_id'], dict) and '$oid' in data['_id']:
-                article_id = data['_id']['$oid']
-            elif isinstance(data['_id'], str) or isinstance(data['_id'], int):
-                article_id = str(data['_id'])
+        raw_id = get('_id')
+        if isinstance(raw_id, dict):
+            article_id = raw_id.get('$oid')
+        elif isinstance(raw_id, (str, int)):
+            article_id = str(raw_id)
+        else:
+            article_id = None
         
         # Handle datetime
-        published_at = None
-        if 'publishedAt' in data:
-            published_at = cls._parse_datetime(data['publishedAt'])
-        elif 'published_at' in data:
-            published_at = cls._parse_datetime(data['published_at'])
+        raw_published_at = get('publishedAt', get('published_at'))
+        published_at = parse_datetime(raw_published_at) if raw_published_at is not None else None
         
         # Create object
+        title = get('title', '')
         article = cls(
             id=article_id,
-            title=data.get('title', ''),
-            summary=data.get('summary', ''),
-            url=data.get('url', ''),
-            source=data.get('source', ''),
-            category=data.get('category', ''),
+            title=title,
+            # Fall back to title + leading content once here, so downstream code only reads summary
+            summary=get('summary') or f"{title} {(get('content') or '')[:500]}".strip(),
+            url=get('url', ''),
+            source=get('source', ''),
+            category=get('category', ''),
             published_at=published_at,
-            topics=data.get('topics', [])
+            topics=get('topics', [])
         )
         
         return article
@@ -61,22 +67,12 @@ class NewsArticle:
         :param dt_value: Datetime value in various formats
         :return: Parsed datetime object or original value if parsing fails
         """
-        if isinstance(dt_value, str):
-            try:
-                if 'T' in dt_value:
-                    return datetime.fromisoformat(dt_value.replace('Z', '+00:00'))
-                else:
-                    return datetime.strptime(dt_value, '%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                try:
-                    return datetime.strptime(dt_value, '%Y-%m-%d %H:%M:%S %Z')
-                except ValueError:
-                    return dt_value
-        return dt_value
+        return parse_datetime(dt_value)
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, topics: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """Convert object to dictionary representation
         
+        :param topics: Topic entries to write instead of the article's own topics
         :return: Dictionary representation of the news article
         """
         # Create basic dictionary
@@ -86,7 +82,7 @@ class NewsArticle:
             'url': self.url,
             'source': self.source,
             'category': self.category,
-            'topics': self.topics
+            'topics': self.topics if topics is None else topics
         }
         
         # Add ID (if available)
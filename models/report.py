@@ -1,9 +1,15 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from pathlib import Path
 import json
 
-@dataclass
+import orjson
+
+from models._compat import DATACLASS_SLOTS
+from models._datetime import parse_datetime
+
+@dataclass(eq=False, **DATACLASS_SLOTS)
 class Report:
     """Data model for reports, representing column reports generated from topics and related news"""
     
@@ -49,18 +55,7 @@ class Report:
         :param dt_value: Datetime value in various formats
         :return: Parsed datetime object or original value if parsing fails
         """
-        if isinstance(dt_value, str):
-            try:
-                if 'T' in dt_value:
-                    return datetime.fromisoformat(dt_value.replace('Z', '+00:00'))
-                else:
-                    return datetime.strptime(dt_value, '%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                try:
-                    return datetime.strptime(dt_value, '%Y-%m-%d %H:%M:%S %Z')
-                except ValueError:
-                    return dt_value
-        return dt_value
+        return parse_datetime(dt_value)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert object to dictionary representation
@@ -99,8 +94,7 @@ class Report:
         :param file_path: Path to the file
         :return: Report instance
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = orjson.loads(Path(file_path).read_bytes())
         return cls.from_dict(data)
     
     
\ No newline at end of file
@@ -1,7 +1,14 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple
 
-@dataclass
+from models._compat import DATACLASS_SLOTS
+
+
+# Topic fields omitted from to_dict when empty
+_TOPIC_OPTIONAL_FIELDS = ('keywords', 'article_ids', 'selection_reason')
+
+@dataclass(eq=False, **DATACLASS_SLOTS)
 class Topic:
     """Data model for topics, representing topics extracted from articles"""
     
@@ -44,25 +51,26 @@ class Topic:
             'weighted_count': self.weighted_count
         }
         
-        if self.keywords:
-            result['keywords'] = self.keywords
-            
-        if self.article_ids:
-            result['article_ids'] = self.article_ids
-            
-        if self.selection_reason:
-            result['selection_reason'] = self.selection_reason
+        # Optional fields are only written when set
+        for name in _TOPIC_OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value:
+                result[name] = value
             
         return result
     
     
-@dataclass
+@dataclass(eq=False, **DATACLASS_SLOTS)
 class TopicStats:
     """Data model for topic and keyword statistics"""
     
     topics: List[Topic] = field(default_factory=list)
     keywords: List[Dict[str, Any]] = field(default_factory=list)
     
+    # Lazy topic_id -> Topic index, rebuilt when the topics list is replaced or resized
+    _by_id: Optional[Dict[int, Topic]] = field(default=None, init=False, repr=False, compare=False)
+    _by_id_key: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TopicStats':
         """Create a topic statistics object from a dictionary
@@ -92,7 +100,7 @@ class TopicStats:
         
         :return: Sorted list of topics
         """
-        return sorted(self.topics, key=lambda t: t.weighted_count, reverse=True)
+        return sorted(self.topics, key=attrgetter('weighted_count'), reverse=True)
     
     def get_topic_by_id(self, topic_id: int) -> Optional[Topic]:
         """Find topic by ID
@@ -100,9 +108,15 @@ class TopicStats:
         :param topic_id: The topic ID to search for
         :return: Topic instance if found, None otherwise
         """
-        for topic in self.topics:
-            if topic.topic_id == topic_id:
-                return topic
-        return None
+        key = (id(self.topics), len(self.topics))
+        if self._by_id is None or self._by_id_key != key:
+            self._by_id = {topic.topic_id: topic for topic in self.topics}
+            self._by_id_key = key
+        return self._by_id.get(topic_id)
+    
+    def invalidate(self) -> None:
+        """Drop the topic ID index, call after changing topic IDs in place"""
+        self._by_id = None
+        self._by_id_key = None
     
     
\ No newline at end of file
@@ -1,11 +1,18 @@
-import json
-from datetime import datetime
-import pytz
-from typing import Dict, List, Any
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
+from models import NewsArticle, Report
 from utils import setup_logger
 
 
+# Reference news section title per region
+_REFERENCE_NEWS_TITLES = {
+    'tw': '參考新聞',
+    'vt': 'Tin tức tham khảo',
+    'us': 'Reference News'
+}
+
+
 class ReportFormatter:
     """Handle report formatting and compilation functions"""
     
@@ -19,47 +26,55 @@ class ReportFormatter:
         self.logger = setup_logger(f"ReportFormatter-{region}")
         
         # Reference news title
-        self.reference_news_title = 'Reference News'
-        if region == 'tw':
-            self.reference_news_title = '參考新聞'
-        elif region == 'vt':
-            self.reference_news_title = 'Tin tức tham khảo'
+        self.reference_news_title = _REFERENCE_NEWS_TITLES.get(region, 'Reference News')
     
-    def append_reference_news(self, content: str, filtered_news: List[Dict]) -> str:
+    def append_reference_news(self, content: str, filtered_news: List[NewsArticle]) -> str:
         """
         Append reference news list to content
         
         :param content: Report content
-        :param filtered_news: Filtered news list
+        :param filtered_news: Filtered news articles
         :return: Content with appended reference news
         """
-        # Add reference news title
-        result = f"{content}\n\n### {self.reference_news_title}\n\n"
+        # Add reference news title, then all news, joined once
+        parts = [content, "\n\n### ", self.reference_news_title, "\n\n"]
+        parts.extend(
+            f"{i}. [{news.title}]({news.url})\n"
+            for i, news in enumerate(filtered_news, 1)
+        )
         
-        # Add all news
-        for i, news in enumerate(filtered_news, 1):
-            news_title = news.get('title', '')
-            result += f"{i}. [{news_title}]({news.get('url', '')})\n"
+        return "".join(parts)
+    
+    @staticmethod
+    def published_now() -> datetime:
+        """
+        Get the current published time, naive UTC with second precision
         
-        return result
+        :return: Published time
+        """
+        return datetime.now(timezone.utc).replace(microsecond=0, tzinfo=None)
     
     def compile_report(
         self,
-        topic: Dict,
+        topic_id: int,
+        topic_content: str,
         report_content: Dict[str, str],
-        filtered_news: List[Dict],
+        filtered_news: List[NewsArticle],
         sentiment_analysis: Dict[str, List[str]],
         source_lang: str,
-    ) -> Dict[str, Any]:
+        published_at: Optional[datetime] = None,
+    ) -> Report:
         """
         Compile final report
         
-        :param topic: Topic data
+        :param topic_id: Topic ID
+        :param topic_content: Topic content
         :param report_content: Main report content {'title': 'title', 'content': 'content'}
-        :param filtered_news: Filtered news list
+        :param filtered_news: Filtered news articles
         :param sentiment_analysis: Stock sentiment analysis results
         :param source_lang: Source language code
-        :return: Complete report data
+        :param published_at: Published time shared by a batch of reports, defaults to now
+        :return: Complete report
         """
         try:
             # Add reference news to main content
@@ -68,24 +83,22 @@ class ReportFormatter:
                 filtered_news
             )
             
-            # Build basic report
-            report = {
-                'topic_id': topic['topic_id'],
-                'topic_content': topic['content'],
-                'title': report_content['title'],
-                'content': main_content,
-                'published_at': datetime.now(pytz.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
-                'reference_news': [
+            # Build report directly
+            return Report(
+                topic_id=int(topic_id),
+                topic_content=topic_content,
+                title=report_content['title'],
+                content=main_content,
+                published_at=published_at or self.published_now(),
+                reference_news=[
                     {
-                        'title': news.get('title', ''),
-                        'url': news.get('url', ''),
-                        'source': news.get('source', '')
+                        'title': news.title,
+                        'url': news.url,
+                        'source': news.source
                     } 
                     for news in filtered_news
                 ]
-            }
-            
-            return report
+            )
             
         except Exception as e:
             self.logger.error(f"Error compiling report: {str(e)}")
@@ -1,30 +1,32 @@
-import os
-import json
 import asyncio
 from datetime import datetime
-import pytz
-from typing import List, Dict, Any, Optional, Union
-from pathlib import Path
-import re
+from typing import List, Dict, Any, Optional, Union, Callable, Awaitable
 import traceback
+from collections import defaultdict
+
+import orjson
 
 from models import NewsArticle, Topic, TopicStats, Report
-from services import LLMService, PromptService
-from analyzers import NewsFilterAnalyzer, ContentAnalyzer, TopicAnalyzer
+from analyzers import AnalyzerContext, NewsFilterAnalyzer, ContentAnalyzer, TopicAnalyzer
 from analyzers.topic_selector import TopicSelector
-from utils import setup_logger, get_config_loader, PathManager
+from utils import setup_logger, PathManager, FileManager
 from reporting import ReportValidator, ReportFormatter
 
 
+# Indented, UTF-8 output like json.dump(..., ensure_ascii=False, indent=2)
+_JSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
 class BaseReportGenerator:
     """Report generator implementing common report generation logic"""
     
-    def __init__(self, date: str, region: str):
+    def __init__(self, date: str, region: str, ctx: Optional[AnalyzerContext] = None):
         """
         Initialize report generator
         
         :param date: Date string (YYYYMMDD)
         :param region: Region code (tw/us/vt)
+        :param ctx: Shared analyzer services, created if not provided
         """
         self.date = date
         self.region = region
@@ -32,129 +34,215 @@ class BaseReportGenerator:
         # Initialize logger
         self.logger = setup_logger(f"Generators-{region}")
         
+        # Shared services for all analyzers
+        self.ctx = ctx or AnalyzerContext.create()
+        
         # Use ConfigLoader to load configuration
-        self.config_loader = get_config_loader()
+        self.config_loader = self.ctx.config
         
         # Get language for the region from configuration
         self.source_lang = self.config_loader.get_region_language(region)
         
-        # Get weighted source settings
+        # Get weighted source settings (unlisted sources weigh 1.0)
         region_info = self.config_loader.get_region_info(region)
-        self.weighted_sources = region_info.get('weighted_sources', {})
+        self.weighted_sources = defaultdict(lambda: 1.0, region_info.get('weighted_sources', {}))
         
-        # Initialize services
-        self.llm_service = LLMService(
-            temperature=0,
-            model_name="gpt-4o",
-            region=self.region 
+        # Topics processed at the same time (region setting overrides the system default)
+        self.max_concurrent_topics = region_info.get(
+            'max_concurrent_topics',
+            self.config_loader.get_system_config().get('max_concurrent_topics', 4)
         )
-        self.prompt_service = PromptService()
+        
+        # Initialize services
+        self.llm_service = self.ctx.llm
+        self.prompt_service = self.ctx.prompts
         
         # Set paths (using PathManager)
         PathManager.ensure_dir(PathManager.get_output_base(region, date))
         self.output_path = PathManager.get_reports_path(region, date)
         
         # Initialize analyzers
-        self.topic_selector = TopicSelector(region=region, date=date)
-        self.news_filter = NewsFilterAnalyzer(region=region, date=date)
-        self.content_analyzer = ContentAnalyzer(region=region, date=date)
+        self.topic_analyzer = TopicAnalyzer(region=region, date=date, ctx=self.ctx)
+        self.topic_selector = TopicSelector(region=region, date=date, ctx=self.ctx)
+        self.news_filter = NewsFilterAnalyzer(region=region, date=date, ctx=self.ctx)
+        self.content_analyzer = ContentAnalyzer(region=region, date=date, ctx=self.ctx)
         
         # Initialize other tools
-        self.validator = ReportValidator()
+        self.validator = ReportValidator(llm_service=self.llm_service)
         self.formatter = ReportFormatter(region=region)  # Using ReportFormatter from reporting.formatters
+        self.file_manager = FileManager()
+        
+        # Per-topic checkpoint records, loaded lazily by kind
+        self._checkpoints: Dict[str, Dict[str, Any]] = {}
+        
+        # Topic modeling result of this run with the news list and length it was computed for,
+        # so it is computed only once; holding the list keeps its identity from being reused
+        self._topics_cache: Optional[TopicStats] = None
+        self._topics_cache_key: Optional[tuple] = None
     
-    async def select_topics(self, topics_data: TopicStats) -> List[Topic]:
+    async def _analyze_news(self, news_list: List[Union[Dict, NewsArticle]]) -> TopicStats:
         """
-        Select topics most suitable for report generation
+        Run topic modeling once per generator and reuse the result
         
-        :param topics_data: Topic data
-        :return: List of selected topics
+        :param news_list: List of news articles
+        :return: Topic statistics data
         """
-        self.logger.info("Selecting top topics")
+        key = self._topics_cache_key
+        if (self._topics_cache is None or not self._topics_cache.topics or key is None
+                or key[0] is not news_list or key[1] != len(news_list)):
+            self._topics_cache = await self.topic_analyzer.analyze_news(news_list)
+            self._topics_cache_key = (news_list, len(news_list))
+        return self._topics_cache
+    
+    async def _maybe_resume(
+        self,
+        topic_id: int,
+        kind: str,
+        compute: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], Any] = lambda x: x,
+        decode: Callable[[Any], Any] = lambda x: x
+    ) -> Any:
+        """
+        Return the checkpointed result for a topic, or compute and checkpoint it
         
-        # Convert to format expected by TopicAnalyzer
-        topic_analyzer = TopicAnalyzer(region=self.region, date=self.date)
-        selected_topics = await topic_analyzer.select_topics(topics_data)
+        :param topic_id: Topic ID
+        :param kind: Checkpoint kind
+        :param compute: Coroutine factory producing the result
+        :param encode: Convert result to a JSON-serializable value
+        :param decode: Convert stored value back to a result
+        :return: Result
+        """
+        if kind not in self._checkpoints:
+            self._checkpoints[kind] = self.file_manager.read_checkpoint(self.region, self.date, kind)
         
-        return selected_topics
+        checkpoint = self._checkpoints[kind]
+        if str(topic_id) in checkpoint:
+            self.logger.info(f"Resuming {kind} for topic {topic_id} from checkpoint")
+            return decode(checkpoint[str(topic_id)])
+        
+        result = await compute()
+        
+        # Only checkpoint non-empty results so failed work is retried on rerun
+        if result:
+            encoded = encode(result)
+            checkpoint[str(topic_id)] = encoded
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.file_manager.append_checkpoint, topic_id, encoded, self.region, self.date, kind
+            )
+        
+        return result
     
-    async def filter_related_news(self, topic_content: str, news_list: List[Union[Dict, NewsArticle]]) -> List[NewsArticle]:
+    async def _generate_validated_content(
+        self,
+        topic: Topic,
+        filtered_news: List[NewsArticle]
+    ) -> Optional[Dict[str, Any]]:
         """
-        Filter news related to the topic
+        Generate report content and regenerate it while validation fails
         
-        :param topic_content: Topic content
-        :param news_list: News list
-        :return: Filtered news list
+        :param topic: Topic to report on
+        :param filtered_news: News articles related to the topic
+        :return: Last generated report content, or None if no content could be generated
         """
-        try:
-            # Use news_filter to filter news
-            filtered_news = await self.news_filter.filter_related_news(
-                topic_content=topic_content,
-                news_list=news_list
-            )
+        report_content = None
+        reason = "No content generated"
+        for attempt in range(4):
+            if attempt:
+                self.logger.warning(f"Content validation failed: {reason}. Retrying...")
             
-            return filtered_news
+            # 1. Generate report content (retries bypass the response cache, or the same content comes back)
+            generated = await self.content_analyzer.generate_report_content(
+                topic, filtered_news, use_cache=not attempt
+            )
+            if not generated or not generated.get('content'):
+                self.logger.warning(f"Failed to generate report content for topic {topic.topic_id} on attempt {attempt + 1}")
+                continue
+            report_content = generated
             
-        except Exception as e:
-            self.logger.error(f"Error filtering related news: {str(e)}")
-            # Convert dictionaries to NewsArticle objects
-            normalized_news_list = []
-            for news in news_list:
-                if isinstance(news, NewsArticle):
-                    normalized_news_list.append(news)
-                else:
-                    normalized_news_list.append(NewsArticle.from_dict(news))
-            
-            # Sort by time and return the latest 10 news as fallback
-            sorted_news = sorted(
-                normalized_news_list,
-                key=lambda x: x.published_at if x.published_at else "",
-                reverse=True
+            # 2. Validate report content
+            content_valid, reason, word_count = await self.validator.validate_content(
+                content=report_content.get('content', ''),
+                title=report_content.get('title', ''),
+                min_words=500,
+                max_words=2000
             )
-            return sorted_news[:10]
+            if content_valid:
+                return report_content
+        
+        if report_content is not None:
+            # Regardless of what caused the validation to fail, continue with the last generated content
+            self.logger.warning(f"Content validation failed after 3 retries: {reason}")
+            self.logger.info(f"Proceeding with the last generated content despite validation issues: {reason}")
+        return report_content
     
-    async def process_topic(self, topic: Topic, news_list: List[Union[Dict, NewsArticle]]) -> Optional[Report]:
+    async def select_topics(self, topics_data: TopicStats) -> List[Topic]:
+        """
+        Select topics most suitable for report generation
+        
+        :param topics_data: Topic data
+        :return: List of selected topics
+        """
+        self.logger.info("Selecting top topics")
+        
+        selected_topics = await self.topic_analyzer.select_topics(topics_data)
+        
+        return selected_topics
+    
+    async def process_topic(
+        self,
+        topic: Topic,
+        news_list: List[NewsArticle],
+        published_at: Optional[datetime] = None
+    ) -> Optional[Report]:
         """
         Process a single topic
         
         :param topic: Topic to process
-        :param news_list: List of news articles
+        :param news_list: List of news articles, as loaded by _load_news_data
+        :param published_at: Published time shared by all reports of the run, defaults to now
         :return: Generated report or None if processing failed
         """
         try:
             topic_id = topic.topic_id
             self.logger.info(f"Processing topic {topic_id}: {topic.content[:50]}...")
             
-            # Filter related news
-            filtered_news = await self.news_filter.filter_related_news(
-                topic=topic,
-                news_list=news_list
-            )
+            # Filter related news (only LLM results are checkpointed, so a failed filtering is retried on rerun)
+            try:
+                filtered_news = await self._maybe_resume(
+                    topic_id,
+                    "filtered_news",
+                    lambda: self.news_filter.filter_related_news(topic=topic, news_list=news_list),
+                    encode=lambda news: [n.to_dict() if isinstance(n, NewsArticle) else n for n in news],
+                    decode=lambda news: [NewsArticle.from_dict(n) for n in news]
+                )
+            except Exception as e:
+                # 如果發生錯誤，使用前10篇相關新聞
+                self.logger.warning(f"News filtering failed for topic {topic_id}, using the first related articles: {str(e)}")
+                filtered_news = self.news_filter.get_topic_news(topic, news_list)[:10]
             
             if not filtered_news:
                 self.logger.warning(f"No related news found for topic {topic_id}")
                 return None
             
-            # Record used article IDs
-            used_article_ids = [
-                news.id if isinstance(news, NewsArticle) else news.get('_id')
+            # Normalize once, so downstream code only handles NewsArticle objects
+            filtered_news = [
+                news if isinstance(news, NewsArticle) else NewsArticle.from_dict(news)
                 for news in filtered_news
             ]
-            topic.article_ids = used_article_ids
             
-            # Update topic counts
+            # Record used article IDs and update topic counts
+            weights = self.weighted_sources
+            topic.article_ids = [news.id for news in filtered_news]
             topic.count = len(filtered_news)
-            topic.weighted_count = sum(
-                self.weighted_sources.get(
-                    news.source if isinstance(news, NewsArticle) else news.get('source', ''),
-                    1.0
-                )
-                for news in filtered_news
-            )
+            topic.weighted_count = sum(weights[news.source] for news in filtered_news)
             
-            # 1. Generate report content
-            report_content = await self.content_analyzer.generate_report_content(topic, filtered_news)
-            if not report_content or not report_content.get('content'):
+            # Generate and validate report content, checkpointing the final result
+            report_content = await self._maybe_resume(
+                topic_id,
+                "report_content",
+                lambda: self._generate_validated_content(topic, filtered_news)
+            )
+            if not report_content:
                 self.logger.warning(f"Failed to generate report content for topic {topic_id}, using fallback content")
                 # Use fallback content instead of returning None
                 report_content = {
@@ -163,50 +251,17 @@ class BaseReportGenerator:
                                f"This topic is about {topic.content}."
                 }
             
-            # 2. Validate report content
-            content_valid, reason, word_count = await self.validator.validate_content(
-                content=report_content.get('content', ''),
-                title=report_content.get('title', ''),
-                min_words=500,
-                max_words=2000
-            )
-            
-            # If content validation fails, regenerate
-            retry_count = 0
-            while not content_valid and retry_count < 3:
-                self.logger.warning(f"Content validation failed: {reason}. Retrying...")
-                retry_count += 1
-                
-                # Regenerate report content
-                report_content = await self.content_analyzer.generate_report_content(topic, filtered_news)
-                if not report_content or not report_content.get('content'):
-                    self.logger.warning(f"Failed to regenerate report content for topic {topic_id}, using last valid content or fallback")
-                    # If there was valid content before, use that; otherwise use fallback content
-                    if not report_content:
-                        report_content = {
-                            'title': getattr(topic, 'title', f"Topic {topic_id}"),
-                            'content': f"This is a placeholder report for topic {topic_id} after failed retry. " +
-                                      f"This topic is about {topic.content}."
-                        }
-                    # Don't return None, ensure there's content to proceed with
-            
-            if not content_valid:
-                self.logger.warning(f"Content validation failed after {retry_count} retries: {reason}")
-                # Regardless of what caused the validation to fail, continue with the last generated content
-                self.logger.info(f"Proceeding with the last generated content despite validation issues: {reason}")
-            
-            # Compile final report (first get dictionary using formatter, then convert to Report object)
-            report_dict = self.formatter.compile_report(
-                topic=topic.to_dict(),
+            # Compile final report
+            report = self.formatter.compile_report(
+                topic_id=topic.topic_id,
+                topic_content=topic.content,
                 report_content=report_content,
-                filtered_news=[news.to_dict() if isinstance(news, NewsArticle) else news for news in filtered_news],
+                filtered_news=filtered_news,
                 sentiment_analysis={},  # Empty sentiment analysis result
-                source_lang=self.source_lang
+                source_lang=self.source_lang,
+                published_at=published_at
             )
             
-            # Convert to Report object
-            report = Report.from_dict(report_dict)
-            
             self.logger.info(f"Successfully processed topic {topic_id}")
             return report
         
@@ -233,10 +288,8 @@ class BaseReportGenerator:
             
             # 2. Use topic analyzer for topic modeling and selection
             self.logger.info("Analyzing news and generating topics...")
-            topic_analyzer = TopicAnalyzer(region=self.region, date=self.date)
-            
             # Perform topic modeling
-            topics_data = await topic_analyzer.analyze_news(news_list)
+            topics_data = await self._analyze_news(news_list)
             
             if not topics_data or not topics_data.topics:
                 self.logger.warning("No topics generated from news analysis")
@@ -247,7 +300,7 @@ class BaseReportGenerator:
             
             # 3. Select topics
             self.logger.info("Selecting top topics...")
-            selected_topics = await topic_analyzer.select_topics(topics_data)
+            selected_topics = await self.topic_analyzer.select_topics(topics_data)
             
             if not selected_topics:
                 self.logger.warning("No topics selected for report generation")
@@ -255,7 +308,14 @@ class BaseReportGenerator:
             
             # 4. Process multiple topics in parallel
             self.logger.info(f"Processing {len(selected_topics)} topics in parallel...")
-            tasks = [self.process_topic(topic, news_list) for topic in selected_topics]
+            semaphore = asyncio.Semaphore(self.max_concurrent_topics)
+            published_at = self.formatter.published_now()
+            
+            async def bounded_process_topic(topic: Topic) -> Optional[Report]:
+                async with semaphore:
+                    return await self.process_topic(topic, news_list, published_at)
+            
+            tasks = [bounded_process_topic(topic) for topic in selected_topics]
             reports_results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # 5. Filter out exceptions and None results
@@ -288,11 +348,8 @@ class BaseReportGenerator:
         :return: List of topics
         """
         try:
-            # Use TopicAnalyzer for topic modeling
-            topic_analyzer = TopicAnalyzer(region=self.region, date=self.date)
-            
-            # Perform topic modeling
-            topics_stats = await topic_analyzer.analyze_news(news_list)
+            # Perform topic modeling (reuses this run's result if already computed)
+            topics_stats = await self._analyze_news(news_list)
             
             # Return topic list
             return topics_stats.topics
@@ -313,8 +370,7 @@ class BaseReportGenerator:
             # Convert TopicStats object to dictionary
             topics_dict = topics_data.to_dict()
             
-            with open(topics_path, 'w', encoding='utf-8') as f:
-                json.dump(topics_dict, f, ensure_ascii=False, indent=2)
+            FileManager.write_atomic(topics_path, orjson.dumps(topics_dict, option=_JSON_DUMP_OPTIONS))
                 
             self.logger.info(f"Topics data saved to {topics_path}")
         except Exception as e:
@@ -334,8 +390,7 @@ class BaseReportGenerator:
                 self.logger.warning(f"Topics data file not found: {file_path}")
                 return TopicStats()
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = orjson.loads(file_path.read_bytes())
             
             # Convert to TopicStats object
             return TopicStats.from_dict(data)
@@ -357,11 +412,11 @@ class BaseReportGenerator:
                 self.logger.error(f"News file not found: {news_file}")
                 return []
                 
-            with open(news_file, 'r', encoding='utf-8') as f:
-                news_dicts = json.load(f)
+            news_dicts = orjson.loads(news_file.read_bytes())
             
             # Convert dictionaries to NewsArticle objects
-            return [NewsArticle.from_dict(news_dict) for news_dict in news_dicts]
+            from_dict = NewsArticle.from_dict
+            return [from_dict(news_dict) for news_dict in news_dicts]
         except Exception as e:
             self.logger.error(f"Error loading news data: {str(e)}")
             return []
@@ -374,14 +429,12 @@ class BaseReportGenerator:
         """
         try:
             # Use PathManager to ensure directory exists
-            path = Path(self.output_path)
-            PathManager.ensure_dir(path.parent)
+            PathManager.ensure_dir(self.output_path.parent)
             
             # Convert Report objects to dictionaries
             report_dicts = [report.to_dict() for report in reports]
             
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                json.dump(report_dicts, f, ensure_ascii=False, indent=2)
+            FileManager.write_atomic(self.output_path, orjson.dumps(report_dicts, option=_JSON_DUMP_OPTIONS))
                 
             self.logger.info(f"Reports saved to {self.output_path}")
         except Exception as e:
@@ -396,8 +449,8 @@ class BaseReportGenerator:
         :param topics_data: Topic statistics data
         """
         try:
-            # Create a mapping of article IDs to their topics
-            article_topics = {}
+            # Create a mapping of article IDs (normalized to strings once) to their topics
+            article_topics = defaultdict(list)
             for topic in topics_data.topics:
                 topic_info = {
                     'topic_id': topic.topic_id,
@@ -407,25 +460,17 @@ class BaseReportGenerator:
                 }
                 # Add this topic info to all articles that belong to this topic
                 for article_id in topic.article_ids:  # 使用新增的 article_ids 屬性
-                    if article_id not in article_topics:
-                        article_topics[article_id] = []
-                    article_topics[article_id].append(topic_info)
+                    article_topics[str(article_id)].append(topic_info)
 
-            # Add topics to news articles
-            news_with_topics = []
-            for article in news_list:
-                article_dict = article.to_dict()
-                article_id = str(article_dict.get('_id'))  # 確保 ID 是字符串形式
-                if article_id in article_topics:
-                    article_dict['topics'] = article_topics[article_id]
-                else:
-                    article_dict['topics'] = []
-                news_with_topics.append(article_dict)
+            # Add topics to news articles in the single to_dict pass (確保 ID 是字符串形式)
+            news_with_topics = [
+                article.to_dict(topics=article_topics.get(str(article.id), []))
+                for article in news_list
+            ]
 
             # Save the combined data
             output_path = PathManager.get_news_with_topics_path(self.region, self.date)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(news_with_topics, f, ensure_ascii=False, indent=2)
+            FileManager.write_atomic(output_path, orjson.dumps(news_with_topics, option=_JSON_DUMP_OPTIONS))
 
             self.logger.info(f"Saved {len(news_with_topics)} news articles with topics to {output_path}")
 
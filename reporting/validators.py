@@ -1,21 +1,46 @@
-import json
 import re
-from typing import Dict, Any, Tuple, List, Union
+
+import orjson
+from typing import Dict, Any, Tuple, List, Union, Optional
 
 from services import LLMService, PromptService, PromptCategory
 from utils import setup_logger
 from models import Report
 
 
+# Common Chinese and English punctuation
+_PUNCTUATION_CHARS = '，。？！、；：""''（）【】《》〈〉『』「」﹁﹂…—－～·.,:;!?[](){}"\'+-*/=_'
+
+# CJK Unified Ideographs and Extension A
+_CJK_RANGES = '\u4e00-\u9fff\u3400-\u4dbf'
+_CJK_RE = re.compile(f'[{_CJK_RANGES}]')
+
+# Translation table mapping CJK ideographs and punctuation to spaces
+_NON_CHINESE_TRANSLATE = dict.fromkeys(range(0x4e00, 0x9fff + 1), ' ')
+_NON_CHINESE_TRANSLATE.update(dict.fromkeys(range(0x3400, 0x4dbf + 1), ' '))
+_NON_CHINESE_TRANSLATE.update(dict.fromkeys(map(ord, _PUNCTUATION_CHARS), ' '))
+
+# "Title:" / "Content:" markers at the start of a line
+_TITLE_LINE_RE = re.compile(r'^title:', re.IGNORECASE | re.MULTILINE)
+_CONTENT_LINE_RE = re.compile(r'^content:', re.IGNORECASE | re.MULTILINE)
+
+# Markdown code block around a JSON response
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+
+
 class ReportValidator:
     """Handle report content validation functionality"""
     
-    def __init__(self):
-        """Initialize report validator"""
+    def __init__(self, llm_service: Optional[LLMService] = None):
+        """
+        Initialize report validator
+        
+        :param llm_service: Shared LLM service, created if not provided
+        """
         self.logger = setup_logger("Report Validator")
         
         # Initialize services
-        self.llm_service = LLMService(
+        self.llm_service = llm_service or LLMService(
             temperature=0,
             model_name="gpt-4o"
         )
@@ -36,15 +61,29 @@ class ReportValidator:
             self.logger.warning("Report content is not a dictionary")
             return False
             
+        if report_content.get('title') and report_content.get('content'):
+            return True
+        
+        # Only distinguish missing from empty fields on the failure path
         if 'title' not in report_content or 'content' not in report_content:
             self.logger.warning("Report content missing required fields (title or content)")
-            return False
-            
-        if not report_content.get('title') or not report_content.get('content'):
+        else:
             self.logger.warning("Report title or content is empty")
+        return False
+    
+    def looks_like_valid_prefix(self, text: str) -> bool:
+        """
+        Check whether the beginning of a streamed response can still become a valid report
+        
+        :param text: Response text received so far
+        :return: False if the response is clearly not in the expected format
+        """
+        head = text.lstrip()[:200]
+        if not head:
             return False
-            
-        return True
+        
+        # JSON or fenced JSON output, or the "Title:" marker from the expected format
+        return head.startswith('{') or head.startswith('```') or 'title:' in head.lower()
     
     def validate_word_count(self, content: str, min_words: int = 100, max_words: int = 2000) -> Tuple[bool, str, int]:
         """
@@ -84,8 +123,12 @@ class ReportValidator:
         # Clean text
         text = text.strip()
         
+        # ASCII text has no Chinese characters, count space-separated words directly
+        if text.isascii():
+            return len(text.split())
+        
         # Count Chinese characters (excluding punctuation and whitespace)
-        chinese_char_count = sum(1 for char in text if self._is_chinese_char(char))
+        chinese_char_count = len(_CJK_RE.findall(text))
         
         # Count space-separated words (suitable for English and Vietnamese)
         space_separated_words = len(text.split())
@@ -96,8 +139,7 @@ class ReportValidator:
             # Chinese-dominated text, count by characters
             self.logger.debug(f"Text appears to be Chinese dominant: {chinese_char_count} Chinese chars in {len(text)} total chars")
             # Add word count for non-Chinese parts (usually quoted English or Vietnamese)
-            non_chinese_text = ''.join(' ' if self._is_chinese_char(char) or char.isspace() or self._is_punctuation(char) else char for char in text)
-            non_chinese_words = len([word for word in non_chinese_text.split() if word])
+            non_chinese_words = len(text.translate(_NON_CHINESE_TRANSLATE).split())
             total_count = chinese_char_count + non_chinese_words
             self.logger.debug(f"Chinese char count: {chinese_char_count}, non-Chinese words: {non_chinese_words}, total: {total_count}")
             return total_count
@@ -128,9 +170,7 @@ class ReportValidator:
         :param char: Single character
         :return: Whether it's punctuation
         """
-        # Common Chinese and English punctuation
-        punctuation_chars = '，。？！、；：""''（）【】《》〈〉『』「」﹁﹂…—－～·.,:;!?[](){}"\'+-*/=_'
-        return char in punctuation_chars or char.isspace()
+        return char in _PUNCTUATION_CHARS or char.isspace()
     
     def extract_title_content(self, text: str) -> Dict[str, str]:
         """
@@ -140,51 +180,46 @@ class ReportValidator:
         :return: {'title': 'title', 'content': 'content'}
         """
         try:
+            text_stripped = text.strip()
+            
             # Try to parse as JSON format
-            if text.strip().startswith('{') and text.strip().endswith('}'):
+            if text_stripped[:1] == '{' and text_stripped[-1:] == '}':
                 try:
-                    data = json.loads(text)
+                    data = orjson.loads(text_stripped)
                     if isinstance(data, dict) and 'title' in data and 'content' in data:
                         return {
                             'title': data['title'],
                             'content': data['content']
                         }
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     pass
             
-            # Try to extract title and content from text
-            lines = text.strip().split('\n')
-            
-            # Find title
-            title_line = None
-            for i, line in enumerate(lines):
-                if line.lower().startswith('title:'):
-                    title_line = i
-                    break
-            
-            # Find content
-            content_line = None
-            for i, line in enumerate(lines):
-                if line.lower().startswith('content:'):
-                    content_line = i
-                    break
+            # Try to extract title and content from text, locating the
+            # "Title:" and "Content:" lines without splitting the whole text
+            title_match = _TITLE_LINE_RE.search(text_stripped)
+            content_match = _CONTENT_LINE_RE.search(text_stripped)
             
             # Extract title and content
-            if title_line is not None and content_line is not None:
-                title = lines[title_line].replace('Title:', '', 1).strip()
-                content = '\n'.join(lines[content_line+1:]).strip()
-                if not content and content_line > 0:
+            if title_match is not None and content_match is not None:
+                # Slice past the matched marker, whatever its case
+                title_end = text_stripped.find('\n', title_match.end())
+                title = (text_stripped[title_match.end():title_end] if title_end != -1 else text_stripped[title_match.end():]).strip()
+                
+                content_end = text_stripped.find('\n', content_match.end())
+                content = text_stripped[content_end + 1:].strip() if content_end != -1 else ''
+                if not content and content_match.start() > 0:
                     # Handle case where content might be on the same line
-                    content = lines[content_line].replace('Content:', '', 1).strip()
+                    content = (text_stripped[content_match.end():content_end] if content_end != -1 else text_stripped[content_match.end():]).strip()
                 return {
                     'title': title,
                     'content': content
                 }
             
-            # If no standard format is found, try to extract based on line numbers
-            if len(lines) > 1:
-                title = lines[0].strip()
-                content = '\n'.join(lines[1:]).strip()
+            # If no standard format is found, use the first line as title
+            first_break = text_stripped.find('\n')
+            if first_break != -1:
+                title = text_stripped[:first_break].strip()
+                content = text_stripped[first_break + 1:].strip()
                 return {
                     'title': title,
                     'content': content
@@ -212,8 +247,7 @@ class ReportValidator:
         :return: Cleaned JSON string
         """
         # Remove Markdown code block markers
-        json_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-        match = re.search(json_pattern, response)
+        match = _JSON_FENCE_RE.search(response)
         if match:
             return match.group(1).strip()
         
@@ -232,8 +266,8 @@ class ReportValidator:
             cleaned_response = self._clean_json_response(response)
             
             # Parse JSON
-            return json.loads(cleaned_response)
-        except json.JSONDecodeError as e:
+            return orjson.loads(cleaned_response)
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"Failed to parse JSON response: {response}")
             self.logger.error(f"JSON error: {str(e)}")
             raise
@@ -299,12 +333,13 @@ class ReportValidator:
             # Parse LLM response
             try:
                 validation_result = self._parse_json_response(response)
-                is_valid = validation_result.get('pass', False)
-                reason = validation_result.get('reason', 'Unknown reason')
-                issues = validation_result.get('issues', [])
+                get = validation_result.get
+                is_valid = get('pass')
+                reason = get('reason') or 'Unknown reason'
+                issues = get('issues') or ()
                 
                 if not is_valid:
-                    issue_details = "; ".join(issues) if issues else ""
+                    issue_details = "; ".join(issues)
                     detailed_reason = f"{reason} {issue_details}".strip()
                     self.logger.warning(f"Content quality validation failed: {detailed_reason}")
                     return False, detailed_reason, word_count
@@ -314,7 +349,7 @@ class ReportValidator:
                 # Return basic validation word count result
                 return True, reason, word_count
                 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 self.logger.error(f"Failed to parse content validation response: {response}")
                 # If parsing fails, use basic validation result
                 return basic_valid, f"{reason} (LLM validation response parsing failed)", word_count
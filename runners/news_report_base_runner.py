@@ -3,27 +3,33 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import pytz
 from pathlib import Path
-import json
 import asyncio
 import time
-import traceback
+
+import orjson
 
 from reporting import BaseReportGenerator
-from utils import setup_logger, get_config_loader, PathManager
+from analyzers import AnalyzerContext
+from utils import setup_logger, get_config_loader, PathManager, FileManager
+
+
+_JSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 
 class NewsReportBaseRunner:
     """Base runner for news report generation"""
     
-    def __init__(self, region: str, date: Optional[str] = None):
+    def __init__(self, region: str, date: Optional[str] = None, ctx: Optional[AnalyzerContext] = None):
         """
         Initialize the runner
         
         :param region: Region code (tw/us/vt)
         :param date: Specified date in YYYYMMDD format. If not specified, current date will be used
+        :param ctx: Shared analyzer services, created by the report generator if not provided
         """
         self.region = region
         self.date = date or datetime.now().strftime('%Y%m%d')
+        self.ctx = ctx
         self.logger = setup_logger(f"NewsReportRunner-{region}")
         
         # Use ConfigLoader to load configuration
@@ -41,6 +47,8 @@ class NewsReportBaseRunner:
         # Use PathManager to set output path
         self.output_path = PathManager.get_output_base(region, self.date)
         PathManager.ensure_dir(self.output_path)
+        self.reports_path = PathManager.get_reports_path(region, self.date)
+        self.summary_path = PathManager.get_execution_summary_path(region, self.date)
     
     def get_categories(self) -> List[str]:
         """Get category list from configuration file"""
@@ -55,7 +63,8 @@ class NewsReportBaseRunner:
             # Generate new reports
             generator = BaseReportGenerator(
                 date=self.date,
-                region=self.region
+                region=self.region,
+                ctx=self.ctx
             )
             
             reports = await generator.execute()
@@ -74,10 +83,20 @@ class NewsReportBaseRunner:
             return reports
             
         except Exception as e:
+            # The traceback is logged once by run(), which handles the re-raised error
             self.logger.error(f"Error generating global reports: {str(e)}")
-            traceback.print_exc()
             raise
     
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """
+        Serialize data and write it atomically to a JSON file
+        
+        :param path: Output file path
+        :param data: JSON-serializable data
+        """
+        FileManager.write_atomic(path, orjson.dumps(data, option=_JSON_DUMP_OPTIONS))
+    
     async def run(self) -> Dict[str, Any]:
         """
         Execute news report generation process
@@ -90,15 +109,16 @@ class NewsReportBaseRunner:
             global_reports = await self.generate_global_reports()
             self.logger.info(f"Successfully generated {len(global_reports)} global reports")
             
+            # Convert Report objects to dictionaries once, reused for saving and the return result
+            global_reports_dicts = [report.to_dict() for report in global_reports]
+            
             # Save global reports
             if global_reports:
-                # Convert Report objects to dictionaries
-                global_reports_dicts = [report.to_dict() for report in global_reports]
-                
-                global_reports_path = PathManager.get_reports_path(self.region, self.date)
-                with open(global_reports_path, 'w', encoding='utf-8') as f:
-                    json.dump(global_reports_dicts, f, ensure_ascii=False, indent=2)
-                self.logger.info(f"Saved {len(global_reports)} global reports to {global_reports_path}")
+                # Encode and write off the event loop so other regions keep running
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._write_json, self.reports_path, global_reports_dicts
+                )
+                self.logger.info(f"Saved {len(global_reports)} global reports to {self.reports_path}")
             
             # Save execution summary
             try:
@@ -109,25 +129,21 @@ class NewsReportBaseRunner:
                     "global_reports_count": len(global_reports)
                 }
                 
-                summary_path = PathManager.get_execution_summary_path(self.region, self.date)
-                with open(summary_path, 'w', encoding='utf-8') as f:
-                    json.dump(summary, f, ensure_ascii=False, indent=2)
-                    
-                self.logger.info(f"Execution summary saved to {summary_path}")
+                self._write_json(self.summary_path, summary)
+                
+                self.logger.info(f"Execution summary saved to {self.summary_path}")
             except Exception as summary_err:
-                self.logger.error(f"Error saving execution summary: {str(summary_err)}")
-                traceback.print_exc()
+                self.logger.exception(f"Error saving execution summary: {str(summary_err)}")
             
             end_time = time.time()
             execution_time = end_time - start_time
             
             return {
-                "global_reports": [report.to_dict() for report in global_reports],  # Also convert to dictionaries in the return result
+                "global_reports": global_reports_dicts,
                 "execution_time": execution_time
             }
         except Exception as e:
-            self.logger.error(f"Error generating reports: {str(e)}")
-            traceback.print_exc()
+            self.logger.exception(f"Error generating reports: {str(e)}")
             return {
                 "global_reports": [],
                 "execution_time": time.time() - start_time,
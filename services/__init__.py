@@ -1,9 +1,10 @@
-from services.llm_service import LLMService, TokenLimitError
+from services.llm_service import LLMService, TokenLimitError, STREAM_INTERRUPTED_ERRORS
 from services.prompt_service import PromptService, PromptCategory
 
 __all__ = [
     'LLMService',
     'TokenLimitError',
+    'STREAM_INTERRUPTED_ERRORS',
     'PromptService',
     'PromptCategory'
 ]
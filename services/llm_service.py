@@ -1,21 +1,105 @@
 import os
-from typing import Optional
-from openai import AsyncOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+import random
+import asyncio
+import functools
+import httpx
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from aiolimiter import AsyncLimiter
+from openai import (
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    APIConnectionError,
+    BadRequestError,
+    InternalServerError,
+    RateLimitError
+)
+from utils import setup_logger, get_config_loader
 
-from utils import setup_logger
+
+# Transient provider errors (throttling, timeouts, 5xx) worth retrying
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError, asyncio.TimeoutError)
+_MAX_ATTEMPTS = 6
+
+# Errors that can interrupt a response stream after it was opened. The SDK doesn't wrap errors
+# raised while reading the body, so a dropped connection surfaces as a raw httpx.TransportError
+# (ReadError, RemoteProtocolError, ReadTimeout). llm_retry only covers opening the stream, so
+# callers consuming chat_stream retry these themselves
+STREAM_INTERRUPTED_ERRORS = (httpx.TransportError, APIConnectionError, asyncio.TimeoutError)
+
+
+def llm_retry(func):
+    """
+    Retry transient provider errors with jittered exponential backoff (1-60 seconds)
+    
+    :param func: Coroutine function to wrap
+    :return: Wrapped coroutine function
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return await func(*args, **kwargs)
+            except _RETRYABLE_ERRORS:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(random.uniform(1, min(60, 2 ** attempt)))
+    return wrapper
+
+
+def _is_context_length_error(error: Exception) -> bool:
+    """
+    Check whether an API error reports that the prompt exceeds the model's context window
+    
+    :param error: Raised exception
+    :return: Whether it is a context length error
+    """
+    return isinstance(error, BadRequestError) and getattr(error, 'code', None) == 'context_length_exceeded'
+
+
+# OpenAI clients shared by all LLMService instances, keyed by (api_key, base_url)
+_CLIENT_CACHE: Dict[Tuple[str, str], AsyncOpenAI] = {}
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """
+    Get the shared OpenAI client for an API key, creating it on first use
+    
+    The client uses a pooled HTTP client so connections are kept alive across requests
+    and across LLMService instances. Retries are handled by llm_retry, so the client's
+    own retries are disabled.
+    
+    :param api_key: OpenAI API key
+    :return: AsyncOpenAI client
+    """
+    base_url = os.getenv("OPENAI_BASE_URL") or ''
+    key = (api_key, base_url)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url or None,
+            max_retries=0,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        )
+        _CLIENT_CACHE[key] = client
+    return client
 
 
 class LLMService:
     """Service for handling interactions with LLM models"""
 
-    def __init__(self, model_name: str = "gpt-4o", temperature: float = 0, region: Optional[str] = None):
+    def __init__(self, model_name: str = "gpt-4o", temperature: float = 0, region: Optional[str] = None,
+                 max_concurrency: Optional[int] = None, requests_per_minute: Optional[int] = None):
         """
         Initialize the LLM service
         
         :param model_name: Name of the model to use
         :param temperature: Model temperature setting
         :param region: Region code, used for logging identification
+        :param max_concurrency: Maximum number of in-flight requests, defaults to llm.max_concurrency in config
+        :param requests_per_minute: Request rate limit, defaults to llm.requests_per_minute in config
         """
         self.logger = setup_logger(f"LLM Service")
         self.model = model_name
@@ -28,36 +112,63 @@ class LLMService:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
         
-        # Initialize OpenAI client
-        self.client = AsyncOpenAI(api_key=api_key)
+        # Reuse the process-wide OpenAI client so connection pools are shared between instances
+        self.client = _get_client(api_key)
+        
+        # Limit in-flight requests and request rate so concurrent callers don't hit rate limits
+        llm_config = get_config_loader().get_llm_config()
+        if max_concurrency is None:
+            max_concurrency = llm_config.get('max_concurrency', 16)
+        if requests_per_minute is None:
+            requests_per_minute = llm_config.get('requests_per_minute', 500)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.rate_limiter = AsyncLimiter(requests_per_minute, 60)
         self.logger.debug(f"Initialized LLMService with model: {model_name}, temperature: {temperature}")
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=2, min=1, max=10))
-    async def chat(self, system_prompt: str, user_prompt: str) -> str:
+    def _build_chat_request(self, system_prompt: str, user_prompt: str,
+                            response_format: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build chat completion request parameters
+        
+        :param system_prompt: System prompt text
+        :param user_prompt: User prompt text
+        :param response_format: Structured output format, free text if not provided
+        :return: Request parameters
+        """
+        request = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+        }
+        if response_format:
+            request["response_format"] = response_format
+        return request
+    
+    @llm_retry
+    async def chat(self, system_prompt: str, user_prompt: str, response_format: Optional[Dict[str, Any]] = None) -> str:
         """
         Conduct a chat with the LLM
         
         :param system_prompt: System prompt text
         :param user_prompt: User prompt text
+        :param response_format: Structured output format (e.g. a JSON schema), free text if not provided
         :return: Model's response text
         """
         try:
             self.logger.debug("Sending chat request")
             
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                temperature=self.temperature,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ]
-            )
+            request = self._build_chat_request(system_prompt, user_prompt, response_format)
+            
+            async with self.semaphore, self.rate_limiter:
+                response = await self.client.chat.completions.create(**request)
             
             return response.choices[0].message.content.strip()
             
         except Exception as e:
-            error_msg = str(e)
-            if "context_length_exceeded" in error_msg:
+            if _is_context_length_error(e):
                 # Raise specific exception for token limit errors
                 raise TokenLimitError("Token limit exceeded")
             
@@ -65,6 +176,95 @@ class LLMService:
             self.logger.info("Retrying...")
             raise
 
+    @llm_retry
+    async def _open_chat_stream(self, request: Dict[str, Any]):
+        """
+        Open a streaming chat completion, retrying transient errors
+        
+        :param request: Request parameters
+        :return: Response stream
+        """
+        try:
+            self.logger.debug("Sending streaming chat request")
+            
+            async with self.rate_limiter:
+                return await self.client.chat.completions.create(**request, stream=True)
+            
+        except Exception as e:
+            if _is_context_length_error(e):
+                # Raise specific exception for token limit errors
+                raise TokenLimitError("Token limit exceeded")
+            
+            self.logger.warning(f"Error in streaming chat request: {str(e)}")
+            self.logger.info("Retrying...")
+            raise
+
+    async def chat_stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """
+        Conduct a chat with the LLM, yielding response text deltas as they arrive
+        
+        Closing the iterator early (e.g. with aclose()) aborts the generation.
+        
+        :param system_prompt: System prompt text
+        :param user_prompt: User prompt text
+        :return: Async iterator of response text deltas
+        """
+        request = self._build_chat_request(system_prompt, user_prompt)
+        
+        async with self.semaphore:
+            stream = await self._open_chat_stream(request)
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await stream.close()
+
+    @llm_retry
+    async def embed(self, text: str, model: str = "text-embedding-3-small") -> List[float]:
+        """
+        Get the embedding vector of a text
+        
+        :param text: Text to embed
+        :param model: Embedding model name
+        :return: Embedding vector
+        """
+        try:
+            self.logger.debug("Sending embedding request")
+            
+            async with self.semaphore, self.rate_limiter:
+                response = await self.client.embeddings.create(model=model, input=text)
+            
+            return response.data[0].embedding
+            
+        except Exception as e:
+            self.logger.warning(f"Error in embedding request: {str(e)}")
+            self.logger.info("Retrying...")
+            raise
+
+
+    @llm_retry
+    async def embed_many(self, texts: List[str], model: str = "text-embedding-3-small") -> List[List[float]]:
+        """
+        Get the embedding vectors of multiple texts in one request
+        
+        :param texts: Texts to embed
+        :param model: Embedding model name
+        :return: Embedding vectors, aligned with texts
+        """
+        try:
+            self.logger.debug(f"Sending embedding request for {len(texts)} texts")
+            
+            async with self.semaphore, self.rate_limiter:
+                response = await self.client.embeddings.create(model=model, input=texts)
+            
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+            
+        except Exception as e:
+            self.logger.warning(f"Error in embedding request: {str(e)}")
+            self.logger.info("Retrying...")
+            raise
+
 
 class TokenLimitError(Exception):
     """Token limit exceeded error"""
@@ -1,8 +1,16 @@
 import yaml
+import functools
+import threading
 from enum import Enum
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-from utils import setup_logger
+from utils import setup_logger, format_template
+
+try:
+    # libyaml C parser, much faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 class PromptCategory(str, Enum):
@@ -19,6 +27,8 @@ class PromptService:
     # Singleton instance and initialization status
     _instance = None
     _is_initialized = False
+    # Guards singleton creation and initialization against concurrent first use
+    _lock = threading.RLock()
 
     def __new__(cls, *args, **kwargs):
         """
@@ -27,7 +37,9 @@ class PromptService:
         :return: Singleton instance of PromptService
         """
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(self, prompt_templates_path: Optional[str] = None):
@@ -40,6 +52,16 @@ class PromptService:
         if self._is_initialized:
             return
 
+        with self._lock:
+            if not self._is_initialized:
+                self._initialize(prompt_templates_path)
+
+    def _initialize(self, prompt_templates_path: Optional[str]):
+        """
+        Load prompt templates, called once under the singleton lock
+        
+        :param prompt_templates_path: Path to prompt templates directory
+        """
         # Set up logger
         self.logger = setup_logger("Prompt Service")
         self.logger.debug("Initializing PromptService...")
@@ -50,6 +72,8 @@ class PromptService:
 
         self.templates_path = Path(prompt_templates_path)
         self.prompts = {}
+        # (mtime_ns, size) of each loaded template file
+        self._template_stats: Dict[Path, Tuple[int, int]] = {}
 
         try:
             # Check if templates directory exists
@@ -68,25 +92,65 @@ class PromptService:
             raise
 
     def _load_prompt_templates(self):
-        """Load all prompt template files"""
+        """Load all prompt template files, reusing templates whose file is unchanged since the last load"""
         template_files = list(self.templates_path.glob("*.yaml"))
         
         if not template_files:
             self.logger.warning(f"No prompt template files found in {self.templates_path}")
+            self.prompts = {}
+            self._template_stats = {}
             return
 
+        prompts = {}
+        template_stats = {}
         for template_file in template_files:
             try:
                 category = template_file.stem  # Use filename as category name
                 
+                # Skip parsing when modification time and size are unchanged
+                stat = template_file.stat()
+                stat_key = (stat.st_mtime_ns, stat.st_size)
+                template_stats[template_file] = stat_key
+                if self._template_stats.get(template_file) == stat_key and category in self.prompts:
+                    prompts[category] = self.prompts[category]
+                    continue
+                
                 with open(template_file, 'r', encoding="utf-8") as f:
-                    template_data = yaml.safe_load(f)
+                    template_data = yaml.load(f, Loader=SafeLoader)
                     # Use file contents directly, no additional structure needed
-                    self.prompts[category] = template_data
+                    prompts[category] = template_data
                 
                 self.logger.debug(f"Loaded prompt template: {template_file}")
             except Exception as e:
                 self.logger.error(f"Error loading template {template_file}: {str(e)}")
+        
+        self.prompts = prompts
+        self._template_stats = template_stats
+
+    @functools.lru_cache(maxsize=64)
+    def _get_template(self, category_value: str, prompt_name: str) -> str:
+        """
+        Get a raw (unformatted) prompt template, memoized until templates are reloaded
+        
+        :param category_value: Prompt category name
+        :param prompt_name: Name of the prompt
+        :return: Prompt template string
+        """
+        # Get prompt dictionary for category
+        prompt_dict = self.prompts.get(category_value)
+        if not prompt_dict:
+            raise KeyError(f"Prompt category not found: {category_value}")
+        
+        # Get specific prompt by name
+        prompt_template = prompt_dict.get(prompt_name)
+        if not prompt_template:
+            raise KeyError(f"Prompt name not found: {prompt_name} in category {category_value}")
+        
+        # Ensure retrieved value is a string
+        if not isinstance(prompt_template, str):
+            raise ValueError(f"Prompt '{prompt_name}' is not a string")
+        
+        return prompt_template
 
     def get_prompt(self, category, prompt_name: str, **kwargs) -> str:
         """
@@ -106,23 +170,13 @@ class PromptService:
                 
             self.logger.debug(f"Getting prompt - category: {category_value}, name: {prompt_name}")
 
-            # Get prompt dictionary for category
-            prompt_dict = self.prompts.get(category_value)
-            if not prompt_dict:
-                raise KeyError(f"Prompt category not found: {category_value}")
-            
-            # Get specific prompt by name
-            prompt_template = prompt_dict.get(prompt_name)
-            if not prompt_template:
-                raise KeyError(f"Prompt name not found: {prompt_name} in category {category_value}")
+            prompt_template = self._get_template(category_value, prompt_name)
             
-            # Ensure retrieved value is a string
-            if not isinstance(prompt_template, str):
-                raise ValueError(f"Prompt '{prompt_name}' is not a string")
+            if not kwargs:
+                return prompt_template
             
             # Format prompt with provided parameters
-            result = prompt_template.format(**kwargs) if kwargs else prompt_template
-            return result
+            return format_template(prompt_template, kwargs)
         
         except KeyError as e:
             error_msg = f"Prompt not found: {e}"
@@ -140,8 +194,10 @@ class PromptService:
         :return: Whether reload was successful
         """
         try:
-            self.prompts = {}
-            self._load_prompt_templates()
+            with self._lock:
+                self._load_prompt_templates()
+                # Cleared after loading so lookups during the reload can't cache stale templates
+                self._get_template.cache_clear()
             self.logger.info("Prompt templates reloaded successfully")
             return True
         except Exception as e:
@@ -0,0 +1,79 @@
+import logging
+import unittest
+from types import SimpleNamespace
+
+import httpx
+
+from analyzers.content_analyzer import ContentAnalyzer
+from services import STREAM_INTERRUPTED_ERRORS
+
+
+REPORT = "Title: Test report\nContent: " + "word " * 600
+
+
+class _StubValidator:
+    """Validator accepting any response in the Title/Content format"""
+
+    def looks_like_valid_prefix(self, text):
+        return True
+
+    def extract_title_content(self, text):
+        title, content = text.split("\nContent: ", 1)
+        return {'title': title[len("Title: "):], 'content': content}
+
+    def validate_report_format(self, report_content):
+        return bool(report_content.get('title') and report_content.get('content'))
+
+    def validate_word_count(self, content, min_words=100, max_words=2000):
+        word_count = len(content.split())
+        return min_words <= word_count <= max_words, "", word_count
+
+
+class _StubLLMService:
+    """LLM service whose first streams drop mid-response with an httpx error"""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    async def chat_stream(self, system_prompt, user_prompt):
+        self.calls += 1
+        yield REPORT[:20]
+        if self.calls <= self.failures:
+            raise httpx.ReadError("connection reset by peer")
+        yield REPORT[20:]
+
+
+def _make_analyzer(llm_service):
+    """Build a ContentAnalyzer around stub services, without loading the configuration"""
+    analyzer = ContentAnalyzer.__new__(ContentAnalyzer)
+    analyzer.logger = logging.getLogger("test")
+    analyzer.llm_service = llm_service
+    analyzer.prompt_service = SimpleNamespace(get_prompt=lambda **kwargs: "prompt")
+    analyzer.validator = _StubValidator()
+    analyzer.cache = None
+    analyzer.source_lang = "eng"
+    analyzer._topic_index_cache = None
+    return analyzer
+
+
+class StreamInterruptionTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_httpx_read_error_is_a_stream_interruption(self):
+        analyzer = _make_analyzer(_StubLLMService(failures=1))
+        with self.assertRaises(STREAM_INTERRUPTED_ERRORS):
+            await analyzer._stream_report("system", "user")
+
+    async def test_dropped_stream_moves_on_to_next_attempt(self):
+        llm_service = _StubLLMService(failures=2)
+        analyzer = _make_analyzer(llm_service)
+        topic = {'topic_id': 1, 'content': 'test topic'}
+
+        result = await analyzer.generate_report_content(topic, [])
+
+        self.assertEqual(llm_service.calls, 3)
+        self.assertEqual(result['title'], "Test report")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,13 @@
 from utils.logging import setup_logger
+from utils.template import compile_template, format_template
 from utils.config_loader import ConfigLoader, get_config_loader
 from utils.file_manager import FileManager
 from utils.path_manager import PathManager
 
 __all__ = [
     'setup_logger',
+    'compile_template',
+    'format_template',
     'ConfigLoader',
     'get_config_loader',
     'FileManager',
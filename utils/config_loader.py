@@ -1,20 +1,47 @@
 import os
-import yaml
+import functools
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from utils.logging import setup_logger
+from utils.template import format_template
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader():
+    """
+    Import PyYAML on first use, so processes that never parse YAML don't pay its import cost
+    
+    :return: (yaml.load, safe loader class), preferring the libyaml C parser
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    return yaml.load, SafeLoader
 
 
 class ConfigLoader:
     """Configuration loader providing unified configuration reading functionality"""
     
+    __slots__ = (
+        '_initialized', 'logger', 'config_dir', 'config_file', 'prompts_dir',
+        '_config', '_prompts', '_regions', '_sections', '_supported_regions', '_prompt_files'
+    )
+    
     _instance = None  # Singleton instance
+    # Guards singleton creation and cache population so concurrent first use parses each file once
+    _lock = threading.RLock()
     
     def __new__(cls):
         """Implement singleton pattern"""
         if cls._instance is None:
-            cls._instance = super(ConfigLoader, cls).__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(ConfigLoader, cls).__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
     
     def __init__(self):
@@ -22,7 +49,13 @@ class ConfigLoader:
         # Skip if already initialized
         if getattr(self, "_initialized", False):
             return
-            
+        
+        with self._lock:
+            if not self._initialized:
+                self._initialize()
+    
+    def _initialize(self):
+        """Set up paths and empty caches, called once under the singleton lock"""
         self.logger = setup_logger("Config Loader")
         self.logger.info("Initializing ConfigLoader")
         
@@ -34,10 +67,28 @@ class ConfigLoader:
         # Configuration cache
         self._config = None
         self._prompts = {}
+        # Region section of the main configuration, refreshed whenever it is loaded
+        self._regions: Dict[str, Dict[str, Any]] = {}
+        # Top-level sections (llm, system, ...) looked up so far, cleared whenever the configuration is loaded
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        self._supported_regions: Tuple[str, ...] = ()
+        # Prompt category -> YAML file, scanned on first prompt lookup
+        self._prompt_files: Optional[Dict[str, Path]] = None
         
         # Mark as initialized
         self._initialized = True
     
+    def _load_yaml(self, path: Path) -> Any:
+        """
+        Load and parse a YAML file
+        
+        :param path: YAML file path
+        :return: Parsed YAML data
+        """
+        yaml_load, loader = _yaml_loader()
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml_load(f, Loader=loader)
+    
     def get_config(self, reload: bool = False) -> Dict[str, Any]:
         """
         Get main configuration
@@ -46,28 +97,34 @@ class ConfigLoader:
         :return: Configuration dictionary
         """
         if self._config is None or reload:
-            try:
-                if not self.config_file.exists():
-                    self.logger.error(f"Config file not found: {self.config_file}")
-                    return {}
-                
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self._config = yaml.safe_load(f)
-                self.logger.info("Loaded main configuration")
-            except Exception as e:
-                self.logger.error(f"Error loading config: {str(e)}")
-                self._config = {}
+            with self._lock:
+                # Another thread may have loaded it while we waited
+                if self._config is None or reload:
+                    try:
+                        self._config = self._load_yaml(self.config_file)
+                        self.logger.info("Loaded main configuration")
+                    except FileNotFoundError:
+                        self.logger.error(f"Config file not found: {self.config_file}")
+                        return {}
+                    except Exception as e:
+                        self.logger.error(f"Error loading config: {str(e)}")
+                        self._config = {}
+                    self._regions = (self._config or {}).get('regions') or {}
+                    self._supported_regions = tuple(self._regions)
+                    self._sections = {}
+                    self._prompt_files = None
         
         return self._config
     
-    def get_supported_regions(self) -> List[str]:
+    def get_supported_regions(self) -> Tuple[str, ...]:
         """
-        Get list of supported region codes
+        Get supported region codes
         
-        :return: List of all supported region codes
+        :return: Tuple of all supported region codes
         """
-        config = self.get_config()
-        return list(config.get('regions', {}).keys())
+        if self._config is None:
+            self.get_config()
+        return self._supported_regions
     
     def get_region_info(self, region: str) -> Dict[str, Any]:
         """
@@ -76,8 +133,9 @@ class ConfigLoader:
         :param region: Region code
         :return: Region configuration information
         """
-        config = self.get_config()
-        return config.get('regions', {}).get(region, {})
+        if self._config is None:
+            self.get_config()
+        return self._regions.get(region) or {}
     
     def get_region_language(self, region: str) -> str:
         """
@@ -143,13 +201,16 @@ class ConfigLoader:
         try:
             # Look for prompt template in cache
             if category not in self._prompts:
-                prompt_file = self.prompts_dir / f"{category}.yaml"
-                if not prompt_file.exists():
-                    self.logger.error(f"Prompt file not found: {prompt_file}")
-                    return ""
-                
-                with open(prompt_file, 'r', encoding='utf-8') as f:
-                    self._prompts[category] = yaml.safe_load(f)
+                with self._lock:
+                    if category not in self._prompts:
+                        if self._prompt_files is None:
+                            self._prompt_files = {path.stem: path for path in self.prompts_dir.glob("*.yaml")}
+                        prompt_file = self._prompt_files.get(category)
+                        if prompt_file is None:
+                            self.logger.error(f"Prompt file not found: {self.prompts_dir / f'{category}.yaml'}")
+                            return ""
+                        
+                        self._prompts[category] = self._load_yaml(prompt_file)
             
             # Get prompt template
             prompt_template = self._prompts[category].get(prompt_name, "")
@@ -158,20 +219,34 @@ class ConfigLoader:
                 return ""
             
             # Format prompt
-            return prompt_template.format(**kwargs)
+            return format_template(prompt_template, kwargs)
             
         except Exception as e:
             self.logger.error(f"Error getting prompt: {str(e)}")
             return ""
     
+    def _get_section(self, name: str) -> Dict[str, Any]:
+        """
+        Get a top-level configuration section, memoized until the configuration is reloaded
+        
+        :param name: Section name
+        :return: Section dictionary
+        """
+        section = self._sections.get(name)
+        if section is None:
+            section = self.get_config().get(name) or {}
+            # Don't memoize while the configuration failed to load, so later calls retry
+            if self._config is not None:
+                self._sections[name] = section
+        return section
+    
     def get_llm_config(self) -> Dict[str, Any]:
         """
         Get LLM service configuration
         
         :return: LLM configuration dictionary
         """
-        config = self.get_config()
-        return config.get('llm', {})
+        return self._get_section('llm')
     
     def get_system_config(self) -> Dict[str, Any]:
         """
@@ -179,8 +254,7 @@ class ConfigLoader:
         
         :return: System configuration dictionary
         """
-        config = self.get_config()
-        return config.get('system', {})
+        return self._get_section('system')
     
     def get_topic_analysis_config(self) -> Dict[str, Any]:
         """
@@ -188,8 +262,7 @@ class ConfigLoader:
         
         :return: Topic analysis configuration dictionary
         """
-        config = self.get_config()
-        return config.get('topic_analysis', {})
+        return self._get_section('topic_analysis')
     
     def get_report_config(self) -> Dict[str, Any]:
         """
@@ -197,8 +270,16 @@ class ConfigLoader:
         
         :return: Report configuration dictionary
         """
-        config = self.get_config()
-        return config.get('report', {})
+        return self._get_section('report')
+
+
+def _reset_lock_after_fork() -> None:
+    """Give a forked child a fresh lock, in case another thread held it at fork time"""
+    ConfigLoader._lock = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_lock_after_fork)
 
 
 def get_config_loader() -> ConfigLoader:
@@ -1,4 +1,5 @@
-import json
+import os
+import orjson
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -7,6 +8,9 @@ from utils.logging import setup_logger
 from utils.path_manager import PathManager
 
 
+_JSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
 class FileManager:
     """File manager responsible for reading and writing files"""
     
@@ -14,6 +18,33 @@ class FileManager:
         """Initialize the file manager"""
         self.logger = setup_logger("File Manager")
     
+    @staticmethod
+    def write_atomic(file_path: Path, data: bytes) -> None:
+        """
+        Write a file in one pass through a temporary file, so readers never see a partial file
+        
+        :param file_path: Destination file path
+        :param data: File contents
+        """
+        tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            # Don't leave a partial temporary file behind
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
     def read_news_file(self, region: str, date: str, custom_path: Optional[str] = None) -> List[Dict]:
         """
         Read news file
@@ -31,20 +62,19 @@ class FileManager:
                 # Use PathManager to get path
                 file_path = PathManager.get_news_input_path(region, date)
             
-            self.logger.info(f"Reading news from {file_path}")
+            self.logger.info("Reading news from %s", file_path)
             
-            if not file_path.exists():
-                self.logger.warning(f"News file not found: {file_path}")
+            try:
+                news_data = orjson.loads(file_path.read_bytes())
+            except FileNotFoundError:
+                self.logger.warning("News file not found: %s", file_path)
                 return []
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                news_data = json.load(f)
-            
-            self.logger.info(f"Read {len(news_data)} news items from {file_path}")
+            self.logger.info("Read %d news items from %s", len(news_data), file_path)
             return news_data
             
         except Exception as e:
-            self.logger.error(f"Error reading news file: {str(e)}")
+            self.logger.error("Error reading news file: %s", e)
             return []
     
     def save_topics(self, topics_data: Dict, region: str, date: str) -> bool:
@@ -62,14 +92,13 @@ class FileManager:
             # Ensure directory exists
             PathManager.ensure_dir(file_path.parent)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(topics_data, f, ensure_ascii=False, indent=2)
+            self.write_atomic(file_path, orjson.dumps(topics_data, option=_JSON_DUMP_OPTIONS))
             
-            self.logger.info(f"Saved topics data to {file_path}")
+            self.logger.info("Saved topics data to %s", file_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error saving topics data: {str(e)}")
+            self.logger.error("Error saving topics data: %s", e)
             return False
     
     def save_reports(self, reports: List[Dict], region: str, date: str) -> bool:
@@ -87,14 +116,13 @@ class FileManager:
             # Ensure directory exists
             PathManager.ensure_dir(file_path.parent)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(reports, f, ensure_ascii=False, indent=2)
+            self.write_atomic(file_path, orjson.dumps(reports, option=_JSON_DUMP_OPTIONS))
             
-            self.logger.info(f"Saved {len(reports)} reports to {file_path}")
+            self.logger.info("Saved %d reports to %s", len(reports), file_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error saving reports: {str(e)}")
+            self.logger.error("Error saving reports: %s", e)
             return False
     
     def read_topics(self, region: str, date: str) -> Dict:
@@ -109,18 +137,17 @@ class FileManager:
             # Use PathManager to get path
             file_path = PathManager.get_topics_path(region, date)
             
-            if not file_path.exists():
-                self.logger.warning(f"Topics file not found: {file_path}")
+            try:
+                topics_data = orjson.loads(file_path.read_bytes())
+            except FileNotFoundError:
+                self.logger.warning("Topics file not found: %s", file_path)
                 return {"topics": []}
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                topics_data = json.load(f)
-            
-            self.logger.info(f"Read topics data from {file_path}")
+            self.logger.info("Read topics data from %s", file_path)
             return topics_data
             
         except Exception as e:
-            self.logger.error(f"Error reading topics data: {str(e)}")
+            self.logger.error("Error reading topics data: %s", e)
             return {"topics": []}
     
     def read_reports(self, region: str, date: str) -> List[Dict]:
@@ -135,16 +162,75 @@ class FileManager:
             # Use PathManager to get path
             file_path = PathManager.get_reports_path(region, date)
             
-            if not file_path.exists():
-                self.logger.warning(f"Reports file not found: {file_path}")
+            try:
+                reports = orjson.loads(file_path.read_bytes())
+            except FileNotFoundError:
+                self.logger.warning("Reports file not found: %s", file_path)
                 return []
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reports = json.load(f)
-            
-            self.logger.info(f"Read {len(reports)} reports from {file_path}")
+            self.logger.info("Read %d reports from %s", len(reports), file_path)
             return reports
             
         except Exception as e:
-            self.logger.error(f"Error reading reports: {str(e)}")
+            self.logger.error("Error reading reports: %s", e)
             return []
+    
+    def read_checkpoint(self, region: str, date: str, kind: str) -> Dict[str, Any]:
+        """
+        Read per-topic checkpoint records
+        
+        :param region: Region code
+        :param date: Date string (YYYYMMDD)
+        :param kind: Checkpoint kind
+        :return: Stored results keyed by topic ID string
+        """
+        records = {}
+        try:
+            file_path = PathManager.get_checkpoint_path(region, date, kind)
+            
+            try:
+                f = open(file_path, 'rb')
+            except FileNotFoundError:
+                return records
+            
+            with f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # Skip partially written line from an interrupted run
+                        continue
+                    records[str(record['topic_id'])] = record['result']
+            
+            self.logger.info("Read %d %s checkpoint records from %s", len(records), kind, file_path)
+            return records
+            
+        except Exception as e:
+            self.logger.error("Error reading checkpoint: %s", e)
+            return records
+    
+    def append_checkpoint(self, topic_id: Any, result: Any, region: str, date: str, kind: str) -> bool:
+        """
+        Append a per-topic checkpoint record
+        
+        :param topic_id: Topic ID
+        :param result: JSON-serializable result
+        :param region: Region code
+        :param date: Date string (YYYYMMDD)
+        :param kind: Checkpoint kind
+        :return: Whether save was successful
+        """
+        try:
+            file_path = PathManager.get_checkpoint_path(region, date, kind)
+            PathManager.ensure_dir(file_path.parent)
+            
+            with open(file_path, 'ab') as f:
+                f.write(orjson.dumps({'topic_id': topic_id, 'result': result}) + b"\n")
+            
+            return True
+            
+        except Exception as e:
+            self.logger.error("Error saving checkpoint: %s", e)
+            return False
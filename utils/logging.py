@@ -1,7 +1,20 @@
-import logging 
+import logging
 import os
+import functools
 from dotenv import load_dotenv
 
+# Load environment variables, including the log level, once per process
+load_dotenv()
+_LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+_FORMATTER = logging.Formatter("%(asctime)s - %(levelname)s - [%(name)s] - %(message)s")
+
+# The format above never shows thread or process details, so skip collecting them on every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+@functools.lru_cache(maxsize=None)
 def setup_logger(name: str):
     """
     Set up a logger instance with the specified name.
@@ -10,29 +23,23 @@ def setup_logger(name: str):
     :return: A configured logger instance.
     """
 
-    # Load environment variable, including the log level
-    load_dotenv()
-    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-
     # Create a logger and set its logging level
     logger = logging.getLogger(name)
-    logger.setLevel(log_level)
+    logger.setLevel(_LOG_LEVEL)
 
     # If the logger already has handers, return it directly
     if logger.handlers:
-        return logger 
+        return logger
 
     # Create a stream handler, set its format and logging level
     handler = logging.StreamHandler()
-    handler.setFormatter(
-        logging.Formatter("%(asctime)s - %(levelname)s - [%(name)s] - %(message)s")
-    )
-    handler.setLevel(log_level)
+    handler.setFormatter(_FORMATTER)
+    handler.setLevel(_LOG_LEVEL)
 
     # Add the handler to the logger
     logger.addHandler(handler)
 
     # Prevent log propagation
-    logger.propagate = False 
+    logger.propagate = False
 
     return logger
@@ -1,5 +1,6 @@
 from pathlib import Path
 import os
+import functools
 
 
 class PathManager:
@@ -7,21 +8,28 @@ class PathManager:
     Path Manager
     
     Centrally manages all file path logic in the system, providing static methods
-    to obtain paths for various data files.
+    to obtain paths for various data files. Paths are memoized per argument tuple.
     """
     
-    @staticmethod
-    def ensure_dir(path: Path) -> Path:
+    # Directories already created or confirmed by ensure_dir in this process
+    _ensured = set()
+    
+    @classmethod
+    def ensure_dir(cls, path: Path) -> Path:
         """
-        Ensure directory exists and return the path
+        Ensure directory exists and return the path, touching the filesystem only once per directory
         
         :param path: Directory path to ensure
         :return: The ensured path
         """
-        os.makedirs(path, exist_ok=True)
+        key = os.fspath(path)
+        if key not in cls._ensured:
+            os.makedirs(path, exist_ok=True)
+            cls._ensured.add(key)
         return path
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_output_base(region: str, date: str) -> Path:
         """
         Get base output path
@@ -33,6 +41,7 @@ class PathManager:
         return Path(f"data/output/{date}/{region}")
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_news_input_path(region: str, date: str) -> Path:
         """
         Get news input file path
@@ -44,6 +53,7 @@ class PathManager:
         return Path(f"data/{region}_news_{date}.json")
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_topics_path(region: str, date: str) -> Path:
         """
         Get topics file path
@@ -52,10 +62,10 @@ class PathManager:
         :param date: Date string (YYYYMMDD)
         :return: Topics file path (data/output/{date}/{region}/topics_{date}.json)
         """
-        base = PathManager.get_output_base(region, date)
-        return base / f"topics_{date}.json"
+        return Path(f"data/output/{date}/{region}/topics_{date}.json")
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_reports_path(region: str, date: str) -> Path:
         """
         Get reports file path
@@ -64,10 +74,10 @@ class PathManager:
         :param date: Date string (YYYYMMDD)
         :return: Reports file path (data/output/{date}/{region}/reports_{date}.json)
         """
-        base = PathManager.get_output_base(region, date)
-        return base / f"reports_{date}.json"
+        return Path(f"data/output/{date}/{region}/reports_{date}.json")
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_execution_summary_path(region: str, date: str) -> Path:
         """
         Get execution summary file path
@@ -76,10 +86,23 @@ class PathManager:
         :param date: Date string (YYYYMMDD)
         :return: Execution summary file path (data/output/{date}/{region}/execution_summary_{date}.json)
         """
-        base = PathManager.get_output_base(region, date)
-        return base / f"execution_summary_{date}.json"
+        return Path(f"data/output/{date}/{region}/execution_summary_{date}.json")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def get_checkpoint_path(region: str, date: str, kind: str) -> Path:
+        """
+        Get per-topic checkpoint file path
+        
+        :param region: Region code
+        :param date: Date string (YYYYMMDD)
+        :param kind: Checkpoint kind (e.g. filtered_news, report_content)
+        :return: Checkpoint file path (data/output/{date}/{region}/checkpoints/{kind}_{date}.jsonl)
+        """
+        return Path(f"data/output/{date}/{region}/checkpoints/{kind}_{date}.jsonl")
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_news_with_topics_path(region: str, date: str) -> Path:
         """
         Get path for news file with topics
@@ -88,5 +111,4 @@ class PathManager:
         :param date: Date string (YYYYMMDD)
         :return: News with topics file path
         """
-        base = PathManager.get_output_base(region, date)
-        return base / f"news_with_topics_{date}.json"
+        return Path(f"data/output/{date}/{region}/news_with_topics_{date}.json")
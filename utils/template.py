@@ -0,0 +1,40 @@
+import functools
+from string import Formatter
+from typing import Any, Dict, Optional, Tuple
+
+
+_FORMATTER = Formatter()
+
+
+@functools.lru_cache(maxsize=64)
+def compile_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """
+    Split a prompt template into (literal, field name) parts once
+
+    :param template: Prompt template string
+    :return: Template parts, or None if the template needs full str.format
+             (positional or attribute fields, conversions, format specs)
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
+def format_template(template: str, kwargs: Dict[str, Any]) -> str:
+    """
+    Format a prompt template, equivalent to template.format(**kwargs)
+
+    :param template: Prompt template string
+    :param kwargs: Formatting parameters
+    :return: Formatted string
+    """
+    parts = compile_template(template)
+    if parts is None:
+        return template.format(**kwargs)
+    return ''.join([
+        literal if field_name is None else literal + format(kwargs[field_name])
+        for literal, field_name in parts
+    ])